@@ -0,0 +1,68 @@
+"""
+Airline Intelligent Assistant Demo.
+
+Example conversation against the orchestrator, kept out of the production
+module so importing it never builds demo data or calls asyncio.run.
+
+Run with: python -m app.agent_registry.AirlineIntelligentAssistant._demo
+"""
+
+import asyncio
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from app.agent_registry.AirlineIntelligentAssistant.main import (
+    setup_airline_intelligent_assistant,
+)
+
+
+async def main():
+    """
+    Example usage of the Airline Intelligent Assistant with thread persistence.
+
+    Independent questions run concurrently, each on its own thread, which also
+    exercises parallel sub-agent tool calls. Questions that rely on conversation
+    memory then run in order on a shared persistent thread.
+    """
+    agent = await setup_airline_intelligent_assistant()
+
+    # Independent queries - no shared context needed, so run them concurrently
+    independent_queries = [
+        "What's the weather like in New York?",
+        "Show me baggage handling performance for last week",
+        "What time is it in UTC?",
+    ]
+
+    # Dependent queries - agent maintains context across all queries in the thread
+    dependent_queries = [
+        "What flights are delayed right now at ORD?",
+        "Can you summarize what I asked about?",  # Tests memory
+    ]
+
+    print("=== Independent Queries (concurrent) ===\n")
+    results = await asyncio.gather(*[agent.run(query) for query in independent_queries])
+    for query, result in zip(independent_queries, results):
+        print(f"User: {query}")
+        print(f"Agent: {result.text}\n")
+
+    # Create a persistent thread for the conversation session
+    # This enables the agent to remember context across multiple queries
+    thread = agent.get_new_thread()
+
+    print("=== Conversation with Persistent Memory ===\n")
+    for query in dependent_queries:
+        print(f"User: {query}")
+        # Pass the same thread to maintain conversation context
+        result = await agent.run(query, thread=thread)
+        print(f"Agent: {result.text}\n")
+
+
+if __name__ == "__main__":
+    # uvloop is optional (not available on Windows); fall back to asyncio
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
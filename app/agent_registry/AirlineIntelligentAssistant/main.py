@@ -6,8 +6,14 @@ This agent coordinates between operational data retrieval and realtime assistanc
 """
 
 import asyncio
+import threading
+from collections import OrderedDict
+from typing import Annotated, Any, Final, Tuple
 
-from app.agent_registry.AirlineOpsContext.main import airline_ops_context_agent
+from agent_framework import AIFunction, ai_function
+from pydantic import Field
+
+from app.agent_registry.AirlineOpsContext.main import get_airline_ops_context_agent
 from app.agent_registry.config_loader import load_agent_config
 from app.agent_registry.RealtimeAssistant.main import setup_realtime_assistant
 from src.agents.azure_openai.main import setup_aoai_agent
@@ -15,6 +21,85 @@ from utils.ml_logging import get_logger
 
 logger = get_logger("app.agent_registry.AirlineIntelligentAssistant.main")
 
+# Sub-agent tool specs (name, description and argument text shown to the model)
+_OPS_CONTEXT_TOOL_KW: Final = {
+    "name": "AirlineOpsContext",
+    "description": (
+        "Query operational data from Microsoft Fabric including flights, baggage, "
+        "routes, airports, and SLA metrics. Use this for airline operational data queries."
+    ),
+    "arg_description": "The operational question about flights, baggage, routes, airports, or SLAs",
+    "icon": "🛫",
+}
+
+_REALTIME_TOOL_KW: Final = {
+    "name": "RealtimeAssistant",
+    "description": (
+        "Access real-time information including web search (Bing), weather data, "
+        "current time, and document search. Use this for current events, weather, "
+        "time queries, or web searches."
+    ),
+    "arg_description": "The query for web search, weather, time, or document search",
+    "icon": "🌐",
+}
+
+# Sub-agent tools keyed by (id(agent), tool name). The agent is stored with the
+# tool so a recycled id() can never return another agent's tool.
+_SUB_AGENT_TOOL_CACHE_MAXSIZE = 8
+_sub_agent_tools: "OrderedDict[Tuple[int, str], Tuple[Any, AIFunction]]" = OrderedDict()
+_sub_agent_tools_lock = threading.Lock()
+
+
+def _get_sub_agent_tool(
+    agent: Any,
+    name: str,
+    description: str,
+    arg_description: str,
+    icon: str,
+) -> AIFunction:
+    """
+    Return a logging function tool that delegates to a sub-agent.
+
+    The .as_tool() conversion and the AIFunction schema generation run once per
+    sub-agent instance; later orchestrator setups reuse the cached tool.
+
+    :param agent: Sub-agent to expose as a tool
+    :param name: Tool name presented to the model
+    :param description: Tool description presented to the model
+    :param arg_description: Description of the single ``query`` argument
+    :param icon: Emoji used in the invocation log banner
+    :return: Function tool wrapping the sub-agent
+    """
+    key = (id(agent), name)
+    with _sub_agent_tools_lock:
+        cached = _sub_agent_tools.get(key)
+        if cached is not None and cached[0] is agent:
+            _sub_agent_tools.move_to_end(key)
+            return cached[1]
+
+    base_tool = agent.as_tool(
+        name=name,
+        description=description,
+        arg_name="query",
+        arg_description=arg_description,
+    )
+
+    async def tool_wrapper(
+        query: Annotated[str, Field(description=arg_description)],
+    ) -> str:
+        logger.info("%s Tool invoked: %s | query: %s", icon, name, query)
+        result = await base_tool(query=query)
+        logger.info("✅ %s completed", name)
+        return result
+
+    tool = ai_function(tool_wrapper, name=name, description=description)
+
+    with _sub_agent_tools_lock:
+        _sub_agent_tools[key] = (agent, tool)
+        while len(_sub_agent_tools) > _SUB_AGENT_TOOL_CACHE_MAXSIZE:
+            _sub_agent_tools.popitem(last=False)
+    return tool
+
 
 async def setup_airline_intelligent_assistant(credential=None):
     """
@@ -31,6 +116,12 @@ async def setup_airline_intelligent_assistant(credential=None):
     :return: Configured ChatAgent instance
     :raises: Exception if agent creation fails or required environment variables are missing
     """
+    # Start the RealtimeAssistant connection first (it authenticates with the
+    # process-wide AzureCliCredential, not the credential passed in here) so
+    # its network setup overlaps with the config loading and AirlineOpsContext
+    # tool wrapping below
+    realtime_task = asyncio.create_task(setup_realtime_assistant())
+
     try:
         # Load dynamic configuration
         logger.info("Loading Airline Intelligent Assistant configuration...")
@@ -47,70 +138,25 @@ async def setup_airline_intelligent_assistant(credential=None):
         logger.info("Initializing sub-agents...")
 
         # Initialize sub-agents
-        # 1. AirlineOpsContext - Already initialized as module-level variable
+        # 1. AirlineOpsContext - Lazily created shared agent for operational data
+        #    (RealtimeAssistant is already connecting in the background)
         logger.info("Using AirlineOpsContext agent for operational data...")
-
-        # 2. RealtimeAssistant - Create async (it creates its own AzureCliCredential internally)
-        logger.info("Creating RealtimeAssistant agent for realtime capabilities...")
-        realtime_agent = await setup_realtime_assistant()
+        ops_agent = await get_airline_ops_context_agent()
 
         # Convert sub-agents to tools using .as_tool()
-        # Wrap with logging to track tool invocations
+        # Wrap with logging to track tool invocations. The wrappers are async so
+        # concurrent tool calls in the same turn can overlap on the event loop.
         logger.info("Converting sub-agents to function tools...")
 
         # Create wrapped tool for AirlineOpsContext with logging
-        ops_base_tool = airline_ops_context_agent.as_tool(
-            name="AirlineOpsContext",
-            description=(
-                "Query operational data from Microsoft Fabric including flights, baggage, "
-                "routes, airports, and SLA metrics. Use this for airline operational data queries."
-            ),
-            arg_name="query",
-            arg_description="The operational question about flights, baggage, routes, airports, or SLAs",
-        )
+        ops_context_tool = _get_sub_agent_tool(ops_agent, **_OPS_CONTEXT_TOOL_KW)
 
-        async def ops_context_tool_wrapper(query: str) -> str:
-            logger.info("=" * 80)
-            logger.info("🛫 TOOL INVOKED: AirlineOpsContext")
-            logger.info(f"📋 Query: {query}")
-            logger.info("=" * 80)
-            result = await ops_base_tool(query)
-            logger.info("✅ AirlineOpsContext completed")
-            return result
-
-        ops_context_tool_wrapper.__name__ = "AirlineOpsContext"
-        ops_context_tool_wrapper.__doc__ = (
-            "Query operational data from Microsoft Fabric including flights, baggage, "
-            "routes, airports, and SLA metrics. Use this for airline operational data queries."
-        )
+        # 2. RealtimeAssistant - Wait for the background setup to finish
+        logger.info("Waiting for RealtimeAssistant agent for realtime capabilities...")
+        realtime_agent = await realtime_task
 
         # Create wrapped tool for RealtimeAssistant with logging
-        realtime_base_tool = realtime_agent.as_tool(
-            name="RealtimeAssistant",
-            description=(
-                "Access real-time information including web search (Bing), weather data, "
-                "current time, and document search. Use this for current events, weather, "
-                "time queries, or web searches."
-            ),
-            arg_name="query",
-            arg_description="The query for web search, weather, time, or document search",
-        )
-
-        async def realtime_tool_wrapper(query: str) -> str:
-            logger.info("=" * 80)
-            logger.info("🌐 TOOL INVOKED: RealtimeAssistant")
-            logger.info(f"📋 Query: {query}")
-            logger.info("=" * 80)
-            result = await realtime_base_tool(query)
-            logger.info("✅ RealtimeAssistant completed")
-            return result
-
-        realtime_tool_wrapper.__name__ = "RealtimeAssistant"
-        realtime_tool_wrapper.__doc__ = (
-            "Access real-time information including web search (Bing), weather data, "
-            "current time, and document search. Use this for current events, weather, "
-            "time queries, or web searches."
-        )
+        realtime_tool = _get_sub_agent_tool(realtime_agent, **_REALTIME_TOOL_KW)
 
         logger.info("Creating main orchestrator agent...")
 
@@ -120,54 +166,23 @@ async def setup_airline_intelligent_assistant(credential=None):
             endpoint=endpoint,
             api_key=api_key,
             deployment_name=deployment,
-            tools=[ops_context_tool_wrapper, realtime_tool_wrapper],
+            tools=[ops_context_tool, realtime_tool],
             instructions=instructions,
             description=description,
         )
 
-        logger.info(f"Airline Intelligent Assistant '{name}' initialized successfully")
+        logger.info("Airline Intelligent Assistant '%s' initialized successfully", name)
         logger.info("Main agent has access to: AirlineOpsContext, RealtimeAssistant")
 
         return main_agent
 
     except KeyError as e:
-        logger.error(f"Missing required configuration key: {e}")
+        logger.error("Missing required configuration key: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Failed to create Airline Intelligent Assistant: {str(e)}")
+        logger.error("Failed to create Airline Intelligent Assistant: %s", e)
         raise
-
-
-# Example usage
-async def main():
-    """
-    Example usage of the Airline Intelligent Assistant with thread persistence.
-
-    Thread management enables conversation memory across multiple queries,
-    allowing the agent to maintain context and reference previous interactions.
-    """
-    agent = await setup_airline_intelligent_assistant()
-
-    # Create a persistent thread for the conversation session
-    # This enables the agent to remember context across multiple queries
-    thread = agent.get_new_thread()
-
-    # Example queries - agent maintains context across all queries in the thread
-    queries = [
-        "What flights are delayed right now at ORD?",
-        "What's the weather like in New York?",
-        "Show me baggage handling performance for last week",
-        "What time is it in UTC?",
-        "Can you summarize what I asked about?",  # Tests memory
-    ]
-
-    print("=== Conversation with Persistent Memory ===\n")
-    for query in queries:
-        print(f"User: {query}")
-        # Pass the same thread to maintain conversation context
-        result = await agent.run(query, thread=thread)
-        print(f"Agent: {result.text}\n")
-
-
-if __name__ == "__main__":
-    asyncio.run(main())
+    finally:
+        # Don't leave the background setup running if we bailed out early
+        if not realtime_task.done():
+            realtime_task.cancel()
@@ -0,0 +1,119 @@
+"""
+Tool Result Cache Module.
+
+Small LRU + TTL cache used to short-circuit repeated Fabric queries issued by
+the AirlineOpsContext tools. Keys are content-addressed (sha256 of the caller's
+identity, the Fabric endpoint and the canonicalized query) so equivalent
+questions from the same identity share one entry, and no identity ever reads
+results fetched with another's credential.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+DEFAULT_CACHE_MAXSIZE: int = 512
+DEFAULT_CACHE_TTL_SEC: float = 300.0
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_WRAPPING_CHARS = "\"'`\u201c\u201d\u2018\u2019"
+_TRAILING_PUNCTUATION = "?.! "
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time-to-live.
+
+    A TTL of 0 (or less) disables caching entirely.
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_CACHE_MAXSIZE, ttl: float = DEFAULT_CACHE_TTL_SEC
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonicalize a query for cache and single-flight keying.
+
+    Trims whitespace and surrounding quotes/backticks, drops trailing "?", "."
+    and "!", lowercases and collapses internal whitespace, so trivially
+    different phrasings of the same question share one key.
+    """
+    canonical = query.strip().strip(_WRAPPING_CHARS).strip()
+    canonical = canonical.rstrip(_TRAILING_PUNCTUATION).lower()
+    return _WHITESPACE_RE.sub(" ", canonical)
+
+
+def make_cache_key(
+    endpoint: Optional[str], query: str, identity: Optional[Hashable] = None
+) -> str:
+    """
+    Build a content-addressed key from the identity, endpoint and normalized query.
+
+    :param endpoint: Fabric endpoint the query is sent to
+    :param query: Query text; normalized with normalize_query
+    :param identity: Caller identity the result is fetched with, or None if shared
+    """
+    scope = "" if identity is None else str(identity)
+    payload = f"{scope}|{endpoint or ''}|{normalize_query(query)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _ttl_from_env() -> float:
+    """Read OPS_CONTEXT_CACHE_TTL (seconds); falls back to the default on bad input."""
+    raw = os.getenv("OPS_CONTEXT_CACHE_TTL")
+    if raw is None or raw == "":
+        return DEFAULT_CACHE_TTL_SEC
+    try:
+        return float(raw)
+    except ValueError:
+        return DEFAULT_CACHE_TTL_SEC
+
+
+# Shared cache for Fabric responses (set OPS_CONTEXT_CACHE_TTL=0 to disable)
+fabric_response_cache = TTLCache(maxsize=DEFAULT_CACHE_MAXSIZE, ttl=_ttl_from_env())
@@ -0,0 +1,104 @@
+"""
+Token Cache Module.
+
+Async wrapper around an Azure credential that keeps access tokens in memory
+and refreshes them in the background shortly before they expire, so Fabric
+tool calls never wait on token acquisition in the common case.
+"""
+
+import asyncio
+import inspect
+import itertools
+import time
+from typing import Any, Dict, Set, Tuple
+
+from utils.ml_logging import get_logger
+
+logger = get_logger("app.agent_registry.AirlineOpsContext.token_cache")
+
+DEFAULT_REFRESH_MARGIN_SEC: float = 300.0
+# Treat tokens this close to expiry as unusable and fetch inline
+EXPIRY_SKEW_SEC: float = 30.0
+
+# Source of CachedTokenCredential.identity values; never reused in a process
+_identity_counter = itertools.count(1)
+
+
+class CachedTokenCredential:
+    """
+    Credential wrapper exposing an async ``get_token`` backed by a per-scope cache.
+
+    - Fresh token: returned immediately.
+    - Token within ``refresh_margin_sec`` of expiry: returned immediately while a
+      background task fetches a new one.
+    - Missing or expired token: fetched inline.
+
+    Sync azure-identity credentials are called via asyncio.to_thread so MSAL
+    work never runs on the event loop.
+    """
+
+    def __init__(
+        self, credential: Any, refresh_margin_sec: float = DEFAULT_REFRESH_MARGIN_SEC
+    ) -> None:
+        self.credential = credential
+        self.refresh_margin_sec = refresh_margin_sec
+        # Scopes per-identity caches (e.g. Fabric results) to this credential
+        self.identity: int = next(_identity_counter)
+        self._tokens: Dict[Tuple[str, ...], Any] = {}
+        self._refresh_tasks: Dict[Tuple[str, ...], asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> Any:
+        """Return an access token for the given scopes, refreshing as needed."""
+        token = self._tokens.get(scopes)
+        if token is not None:
+            remaining = token.expires_on - time.time()
+            if remaining > EXPIRY_SKEW_SEC:
+                if remaining < self.refresh_margin_sec:
+                    self._schedule_refresh(scopes)
+                return token
+
+        return await self._refresh(scopes)
+
+    async def _refresh(self, scopes: Tuple[str, ...]) -> Any:
+        task = self._refresh_tasks.get(scopes)
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.create_task(self._fetch(scopes))
+            self._refresh_tasks[scopes] = task
+        # Concurrent cold callers share the same in-flight fetch
+        return await asyncio.shield(task)
+
+    async def _fetch(self, scopes: Tuple[str, ...]) -> Any:
+        get_token = self.credential.get_token
+        if inspect.iscoroutinefunction(get_token):
+            token = await get_token(*scopes)
+        else:
+            token = await asyncio.to_thread(get_token, *scopes)
+        self._tokens[scopes] = token
+        return token
+
+    def _schedule_refresh(self, scopes: Tuple[str, ...]) -> None:
+        task = self._refresh_tasks.get(scopes)
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is asyncio.get_running_loop()
+        ):
+            return
+
+        task = asyncio.create_task(self._fetch(scopes))
+        self._refresh_tasks[scopes] = task
+        self._background.add(task)
+        task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Background token refresh failed: %s", exc)
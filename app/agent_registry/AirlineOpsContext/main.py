@@ -1,10 +1,23 @@
+"""
+Airline Ops Context Agent Factory.
+
+Azure OpenAI agent that answers operational questions using governed
+Microsoft Fabric data through the retrieve_operational_context tool.
+"""
+
+import asyncio
+import threading
+from typing import Optional
+
+from agent_framework import ChatAgent
+
 from app.agent_registry.AirlineOpsContext import tools as ops_tools
 from app.agent_registry.AirlineOpsContext.tools import retrieve_operational_context
 from app.agent_registry.config_loader import load_agent_config
 from src.agents.azure_openai.main import setup_aoai_agent
 from utils.ml_logging import get_logger
 
-logger = get_logger("agent_registry.azure_openai.airline_ops_context_agent")
+logger = get_logger("app.agent_registry.AirlineOpsContext.main")
 
 # ===============================
 # CREDENTIAL CACHING
@@ -31,6 +44,39 @@ def set_azure_credential(credential):
     logger.info("Azure credential set for AirlineOpsContext agent and tools")
 
 
+def use_azure_credential(credential):
+    """
+    Bind the caller's credential to the current context for tool calls.
+
+    Call this before running the agent for a given user session so Fabric
+    requests use that session's identity rather than the last one set.
+
+    Args:
+        credential: Azure credential object for the current session
+    """
+    ops_tools.use_azure_credential(credential)
+
+
+async def prewarm_fabric_token(credential=None):
+    """
+    Acquire a Fabric token in the background before the first query.
+
+    Args:
+        credential: Azure credential to warm (defaults to the one already set)
+    """
+    await ops_tools.prewarm_fabric_token(credential)
+
+
+async def prewarm_fabric_agent(credential=None):
+    """
+    Acquire a Fabric token and create the shared Fabric assistant before the first query.
+
+    Args:
+        credential: Azure credential to warm (defaults to the one already set)
+    """
+    await ops_tools.prewarm_fabric_agent(credential)
+
+
 # ===============================
 # LOAD DYNAMIC CONFIGURATION
 # ===============================
@@ -57,12 +103,39 @@ logger.info(f"Loaded configuration for agent: {NAME}")
 # AGENT SETUP
 # ===============================
 
-airline_ops_context_agent = setup_aoai_agent(
-    name=NAME,
-    endpoint=ENDPOINT,
-    api_key=API_KEY,
-    deployment_name=DEPLOYMENT_NAME,
-    tools=[retrieve_operational_context],
-    instructions=INSTRUCTIONS,
-    description=DESCRIPTION,
-)
+# Built lazily on first use so importing this module does no client construction
+_airline_ops_context_agent: Optional[ChatAgent] = None
+_agent_lock = threading.Lock()
+
+
+def _build_airline_ops_context_agent() -> ChatAgent:
+    """Create the agent once; safe to call concurrently from worker threads."""
+    global _airline_ops_context_agent
+    with _agent_lock:
+        if _airline_ops_context_agent is None:
+            _airline_ops_context_agent = setup_aoai_agent(
+                name=NAME,
+                endpoint=ENDPOINT,
+                api_key=API_KEY,
+                deployment_name=DEPLOYMENT_NAME,
+                tools=[retrieve_operational_context],
+                instructions=INSTRUCTIONS,
+                description=DESCRIPTION,
+            )
+        return _airline_ops_context_agent
+
+
+async def get_airline_ops_context_agent() -> ChatAgent:
+    """
+    Return the AirlineOpsContext agent, creating it on first call.
+
+    Construction runs in a worker thread so it does not block the event loop
+    and can overlap with other sub-agent setup. A threading lock (rather than
+    an asyncio.Lock) guards creation because callers such as Streamlit run
+    each request on a fresh event loop.
+
+    :return: Shared ChatAgent instance
+    """
+    if _airline_ops_context_agent is not None:
+        return _airline_ops_context_agent
+    return await asyncio.to_thread(_build_airline_ops_context_agent)
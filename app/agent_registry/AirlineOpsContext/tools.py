@@ -1,30 +1,207 @@
-from typing import Annotated
+"""
+Airline Ops Context Tools Module.
+
+Function tools that retrieve operational context from Microsoft Fabric data
+agents, with result caching and in-flight de-duplication.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from collections import OrderedDict
+from typing import Annotated, Dict, Optional
 
 from pydantic import Field
 
-from src.agents.dataagents.main import ask_fabric_agent
+from app.agent_registry.AirlineOpsContext._cache import (
+    fabric_response_cache,
+    make_cache_key,
+)
+from app.agent_registry.AirlineOpsContext._token_cache import CachedTokenCredential
+from src.agents.dataagents.main import (
+    FABRIC_SCOPE,
+    aask_fabric_agent,
+    aprewarm_fabric_agent,
+)
 from utils.ml_logging import get_logger
 
-logger = get_logger("src.agents.dataagents")
+logger = get_logger("app.agent_registry.AirlineOpsContext.tools")
 _airport_info_endpoint = None
 _azure_credential = None
 
+# Credential bound to the current request context (e.g. one Streamlit session's
+# query); overrides the process-wide default set by set_azure_credential
+_request_credential: contextvars.ContextVar[Optional[CachedTokenCredential]] = (
+    contextvars.ContextVar("ops_context_credential", default=None)
+)
+
+# One token-caching wrapper per raw credential, keyed by id(credential), so
+# re-binding the same credential keeps its warm tokens. Each wrapper holds its
+# credential, which also guards against a recycled id(); the map is bounded so
+# ended sessions don't keep their credentials alive.
+CREDENTIAL_WRAPPERS_MAX: int = 32
+_credential_wrappers: "OrderedDict[int, CachedTokenCredential]" = OrderedDict()
+_credential_wrappers_lock = threading.Lock()
+
+_SEP = "=" * 80
+
+# ask_fabric_agent reports failures as strings; never cache those
+_UNCACHEABLE_PREFIXES = (
+    "Error querying Fabric agent",
+    "[Run ended:",
+    "[No text content returned]",
+)
+
 
 def set_airport_endpoint(endpoint: str):
     """Set the Fabric endpoint for airport info queries."""
     global _airport_info_endpoint
     _airport_info_endpoint = endpoint
-    logger.info(f"🌐 Fabric endpoint configured: {endpoint}")
+    logger.info("🌐 Fabric endpoint configured: %s", endpoint)
+
+
+def _wrap_credential(credential) -> Optional[CachedTokenCredential]:
+    """Return the shared CachedTokenCredential wrapper for a raw credential."""
+    if credential is None:
+        return None
+    key = id(credential)
+    with _credential_wrappers_lock:
+        wrapper = _credential_wrappers.get(key)
+        if wrapper is None or wrapper.credential is not credential:
+            wrapper = CachedTokenCredential(credential)
+            _credential_wrappers[key] = wrapper
+        _credential_wrappers.move_to_end(key)
+        while len(_credential_wrappers) > CREDENTIAL_WRAPPERS_MAX:
+            _credential_wrappers.popitem(last=False)
+        return wrapper
 
 
 def set_azure_credential(credential):
-    """Set the cached Azure credential for this module."""
+    """
+    Set the cached Azure credential for this module.
+
+    The credential is wrapped in a token cache that refreshes Fabric tokens in
+    the background, so tool calls don't block on token acquisition.
+    """
     global _azure_credential
-    _azure_credential = credential
+    _azure_credential = _wrap_credential(credential)
     logger.info("🔐 Azure credential cached for AirlineOpsContext tools")
 
 
-def retrieve_operational_context(
+def use_azure_credential(credential) -> None:
+    """
+    Bind a credential to the current context for Fabric tool calls.
+
+    Tasks started from this context (including the agent's tool calls) use it
+    instead of the process-wide default, so concurrent sessions never send
+    Fabric requests with each other's identity.
+
+    :param credential: Azure credential for the current session, or None
+    """
+    _request_credential.set(_wrap_credential(credential))
+
+
+def _current_credential() -> Optional[CachedTokenCredential]:
+    """Return the credential bound to this context, or the process-wide default."""
+    return _request_credential.get() or _azure_credential
+
+
+def _prewarm_wrapper(credential=None) -> Optional[CachedTokenCredential]:
+    """Resolve the credential wrapper to prewarm: explicit, bound or process-wide."""
+    if credential is not None:
+        return _wrap_credential(credential)
+    return _current_credential()
+
+
+async def _prewarm_token(wrapper: CachedTokenCredential) -> None:
+    """Fetch a Fabric token into the wrapper's cache, logging any failure."""
+    try:
+        await wrapper.get_token(FABRIC_SCOPE)
+        logger.info("🔐 Fabric token prewarmed")
+    except Exception as e:
+        logger.warning("Fabric token prewarm failed: %s", e)
+
+
+async def prewarm_fabric_token(credential=None) -> None:
+    """
+    Acquire a Fabric token ahead of the first tool call.
+
+    Populates the credential's token cache (and MSAL's, for interactive
+    credentials) so the first Fabric query doesn't pay for token acquisition.
+    Best-effort: failures are logged and never raised.
+
+    :param credential: Credential to warm; defaults to the bound/process credential
+    """
+    wrapper = _prewarm_wrapper(credential)
+    if wrapper is not None:
+        await _prewarm_token(wrapper)
+
+
+async def prewarm_fabric_agent(credential=None) -> None:
+    """
+    Warm the Fabric token and create the shared assistant before the first query.
+
+    Best-effort, like prewarm_fabric_token. The assistant step is skipped
+    until an endpoint is configured.
+
+    :param credential: Credential to warm; defaults to the bound/process credential
+    """
+    wrapper = _prewarm_wrapper(credential)
+    if wrapper is None:
+        return
+    await _prewarm_token(wrapper)
+    if _airport_info_endpoint:
+        await aprewarm_fabric_agent(_airport_info_endpoint, wrapper)
+
+
+# Single-flight map: concurrent identical queries from the same identity share
+# one Fabric call (keyed like the result cache). The map owns each fetch task,
+# so a cancelled caller (e.g. a Streamlit rerun) never cancels it for the others.
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def _query_fabric(
+    cache_key: str, query: str, credential: Optional[CachedTokenCredential]
+) -> str:
+    """Query the airport info Fabric endpoint and cache a successful response."""
+    response = await aask_fabric_agent(
+        endpoint=_airport_info_endpoint,
+        question=query,
+        credential=credential,
+    )
+    if not response.startswith(_UNCACHEABLE_PREFIXES):
+        fabric_response_cache.set(cache_key, response)
+    return response
+
+
+def _forget_inflight(cache_key: str, task: asyncio.Task) -> None:
+    if _inflight.get(cache_key) is task:
+        del _inflight[cache_key]
+
+
+async def _fetch_operational_context(
+    cache_key: str, query: str, credential: Optional[CachedTokenCredential]
+) -> str:
+    """
+    Fetch from Fabric, joining an identical in-flight request if one exists.
+
+    Every caller awaits the shared fetch task through asyncio.shield, so
+    cancelling one caller leaves the fetch running for the rest.
+    """
+    loop = asyncio.get_running_loop()
+    task = _inflight.get(cache_key)
+    if task is not None and not task.done() and task.get_loop() is loop:
+        logger.info("🔁 Joining in-flight Fabric query")
+    else:
+        task = loop.create_task(_query_fabric(cache_key, query, credential))
+        _inflight[cache_key] = task
+        task.add_done_callback(functools.partial(_forget_inflight, cache_key))
+    return await asyncio.shield(task)
+
+
+async def retrieve_operational_context(
     query: Annotated[
         str,
         Field(
@@ -38,30 +215,42 @@ def retrieve_operational_context(
     This tool queries the governed Fabric data agent to retrieve accurate
     operational information about airline operations including flights,
     baggage handling, routes, airport operations, and SLA metrics.
+    The Fabric call is awaited, so it never blocks the agent event loop.
 
     :param query: The operational question or data request
     :return: Retrieved operational context and data from Fabric
     """
     try:
-        logger.info("=" * 80)
-        logger.info("🔧 TOOL EXECUTION: retrieve_operational_context")
-        logger.info(f"📋 Query: {query}")
-        logger.info("=" * 80)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_SEP)
+            logger.info("🔧 TOOL EXECUTION: retrieve_operational_context")
+            logger.info("📋 Query: %s", query)
+            logger.info(_SEP)
 
-        # Query the Fabric agent with the airport info endpoint
-        # Use cached credential if available
-        response = ask_fabric_agent(
-            endpoint=_airport_info_endpoint,
-            question=query,
-            credential=_azure_credential,
+        # Serve repeated questions from the result cache. Results are scoped to
+        # the caller's credential, so sessions never read each other's data.
+        credential = _current_credential()
+        cache_key = make_cache_key(
+            _airport_info_endpoint,
+            query,
+            credential.identity if credential is not None else None,
         )
+        cached = fabric_response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("⚡ Cache hit - returning cached operational context")
+            logger.info(_SEP)
+            return cached
+
+        # Query the Fabric agent with the airport info endpoint
+        # Identical concurrent calls are de-duplicated
+        response = await _fetch_operational_context(cache_key, query, credential)
 
         logger.info("✅ Operational context retrieved successfully from Fabric")
-        logger.info("=" * 80)
+        logger.info(_SEP)
         return response
 
     except Exception as e:
         error_msg = f"Error retrieving operational context: {str(e)}"
-        logger.error(f"❌ {error_msg}")
-        logger.info("=" * 80)
+        logger.error("❌ %s", error_msg)
+        logger.info(_SEP)
         return error_msg
@@ -8,13 +8,27 @@ Creates an Azure AI Foundry agent with multiple capabilities:
 - Custom function tools (weather, time)
 """
 
+import asyncio
+import dataclasses
+import functools
+import logging
 import os
+import threading
+import types
+import weakref
 from pathlib import Path
-from typing import Optional, Tuple
-
-from agent_framework import ChatAgent, HostedCodeInterpreterTool, HostedWebSearchTool
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+from agent_framework import (
+    ChatAgent,
+    HostedCodeInterpreterTool,
+    HostedFileSearchTool,
+    HostedWebSearchTool,
+)
 from agent_framework.azure import AzureAIAgentClient
 from azure.ai.projects.aio import AIProjectClient
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.identity.aio import AzureCliCredential
 
 from app.agent_registry.config_loader import load_agent_config
@@ -23,6 +37,230 @@ from utils.ml_logging import get_logger
 
 logger = get_logger("app.agent_registry.RealtimeAssistant.main")
 
+_SEP = "=" * 80
+
+# ===============================
+# CONFIG CACHING
+# ===============================
+
+
+@functools.lru_cache(maxsize=4)
+def _load_cfg(agent_name: str) -> Mapping[str, Any]:
+    """
+    Load an agent config once per process as a read-only mapping.
+
+    load_agent_config already memoizes the parsed YAML but returns a deep copy
+    on every call; the realtime paths only read the config, so share one view.
+
+    :param agent_name: Name of the agent (e.g. "REALTIME_ASSISTANT")
+    :return: Read-only agent configuration
+    """
+    return types.MappingProxyType(load_agent_config(agent_name))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _RuntimeEnv:
+    """Environment values read by the realtime paths, captured once."""
+
+    agent_id: Optional[str]
+    bing_conn_id: Optional[str]
+
+
+@functools.lru_cache(maxsize=4)
+def _env(bing_connection_env: str = "BING_CONNECTION_ID") -> _RuntimeEnv:
+    """
+    Read the realtime assistant environment variables once per process.
+
+    :param bing_connection_env: Name of the env var holding the Bing connection ID
+    :return: Frozen snapshot of the relevant environment values
+    """
+    environ = os.environ
+    return _RuntimeEnv(
+        agent_id=environ.get("REALTIME_ASSISTANT_AGENT_ID"),
+        bing_conn_id=environ.get(bing_connection_env),
+    )
+
+
+# ===============================
+# CLIENT CACHING
+# ===============================
+
+# Token scope used by AIProjectClient for Azure AI Foundry
+PROJECT_TOKEN_SCOPE = "https://ai.azure.com/.default"
+
+# Connection pool tuning for the shared aiohttp session
+PROJECT_MAX_CONNECTIONS = 100
+PROJECT_MAX_CONNECTIONS_PER_HOST = 50
+PROJECT_KEEPALIVE_TIMEOUT_SEC = 60
+
+# One AzureCliCredential per process, and one aiohttp session plus one
+# AIProjectClient per endpoint on each event loop (aio transports cannot be
+# shared across loops)
+_credential: Optional[AzureCliCredential] = None
+_project_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AIProjectClient]]"
+) = weakref.WeakKeyDictionary()
+_http_sessions: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]"
+) = weakref.WeakKeyDictionary()
+# Connected ChatAgent wrappers, keyed by agent ID on each event loop (they hold
+# a loop-bound project client)
+_connected_agents: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, ChatAgent]]"
+) = weakref.WeakKeyDictionary()
+_client_lock = threading.Lock()
+
+
+def _get_credential() -> AzureCliCredential:
+    """Return the shared AzureCliCredential, creating it on first use."""
+    global _credential
+    with _client_lock:
+        if _credential is None:
+            logger.info("Creating shared AzureCliCredential")
+            _credential = AzureCliCredential()
+        return _credential
+
+
+def _get_transport(loop: asyncio.AbstractEventLoop) -> AioHttpTransport:
+    """
+    Return an AioHttpTransport over the loop's shared, pool-tuned aiohttp session.
+
+    Must be called with _client_lock held. The session is not owned by the
+    transport, so closing one project client leaves the pool open for others.
+
+    :param loop: Running event loop the session is bound to
+    :return: Transport for a new AIProjectClient
+    """
+    session = _http_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=PROJECT_MAX_CONNECTIONS,
+            limit_per_host=PROJECT_MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=PROJECT_KEEPALIVE_TIMEOUT_SEC,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _http_sessions[loop] = session
+    return AioHttpTransport(session=session, session_owner=False)
+
+
+def _get_project_client(endpoint: str) -> AIProjectClient:
+    """
+    Return the cached AIProjectClient for this endpoint on the running event loop.
+
+    Reusing the client avoids a new CLI token exchange and TLS handshake on
+    every create/connect/delete call.
+
+    :param endpoint: Azure AI Project endpoint URL
+    :return: Shared AIProjectClient instance
+    """
+    credential = _get_credential()
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        clients = _project_clients.setdefault(loop, {})
+        client = clients.get(endpoint)
+        if client is None:
+            logger.info("Creating AIProjectClient with endpoint: %s", endpoint)
+            client = AIProjectClient(
+                endpoint=endpoint,
+                credential=credential,
+                transport=_get_transport(loop),
+            )
+            clients[endpoint] = client
+        return client
+
+
+async def aclose_clients() -> None:
+    """
+    Drop this loop's cached agents and close its project clients and HTTP session.
+
+    The shared credential is left open, since project clients on other event
+    loops still use it; close it with aclose_credential at process shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        clients = _project_clients.pop(loop, {})
+        _connected_agents.pop(loop, None)
+        session = _http_sessions.pop(loop, None)
+
+    for client in clients.values():
+        await client.close()
+    if session is not None:
+        await session.close()
+
+
+async def aclose_credential() -> None:
+    """Close the shared AzureCliCredential. Call once, at process shutdown."""
+    global _credential
+    with _client_lock:
+        credential, _credential = _credential, None
+    if credential is not None:
+        await credential.close()
+
+
+# ===============================
+# STATIC TOOLS
+# ===============================
+
+# Tools that do not depend on the uploaded file, built once per process
+_static_tools: Optional[Tuple[Any, ...]] = None
+_static_tools_lock = threading.Lock()
+
+
+def _build_bing_tool(
+    config: Mapping[str, Any],
+) -> Optional[Tuple[HostedWebSearchTool]]:
+    """
+    Build the Bing Search tool if it is enabled and a connection ID is set.
+
+    :param config: Realtime Assistant configuration
+    :return: One-element tuple with the Bing tool, or None when unavailable
+    """
+    bing_config = config.get("bing_search", {})
+    if not bing_config.get("enabled", False):
+        return None
+
+    bing_connection_id = _env(
+        bing_config.get("connection_id_env", "BING_CONNECTION_ID")
+    ).bing_conn_id
+    if not bing_connection_id:
+        return None
+
+    logger.info("Bing Search tool added")
+    return (
+        HostedWebSearchTool(
+            name=bing_config.get("name", "Bing Grounding Search"),
+            description=bing_config.get(
+                "description", "Search the web for current information"
+            ),
+            connection_id=bing_connection_id,
+        ),
+    )
+
+
+def _get_static_tools(config: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """
+    Return the memoized static tools (Bing, Code Interpreter, weather, time).
+
+    :param config: Realtime Assistant configuration (used on first call only)
+    :return: Tuple of tool definitions shared by every agent creation
+    """
+    global _static_tools
+    with _static_tools_lock:
+        if _static_tools is None:
+            _static_tools = (
+                *(_build_bing_tool(config) or ()),
+                HostedCodeInterpreterTool(
+                    name="Python Code Interpreter",
+                    description="Execute Python code for calculations, data analysis, and problem solving",
+                ),
+                get_weather,
+                get_time,
+            )
+            logger.info(
+                "Code Interpreter and custom function tools added (weather, time)"
+            )
+        return _static_tools
+
 
 async def create_realtime_assistant() -> Tuple[ChatAgent, str, str, str]:
     """
@@ -40,13 +278,13 @@ async def create_realtime_assistant() -> Tuple[ChatAgent, str, str, str]:
     :raises: Exception if creation fails
     """
     try:
-        logger.info("=" * 80)
+        logger.debug(_SEP)
         logger.info("CREATING NEW Realtime Assistant agent")
-        logger.info("=" * 80)
+        logger.debug(_SEP)
 
         # Load configuration
         logger.info("Loading configuration")
-        config = load_agent_config("REALTIME_ASSISTANT")
+        config = _load_cfg("REALTIME_ASSISTANT")
 
         name = config["name"]
         description = config["description"]
@@ -56,74 +294,39 @@ async def create_realtime_assistant() -> Tuple[ChatAgent, str, str, str]:
 
         # Get PDF file path
         pdf_file_path = Path("app/data/airport_operations.pdf")
-        if not pdf_file_path.exists():
+        if not await asyncio.to_thread(pdf_file_path.exists):
             raise FileNotFoundError(f"PDF file not found: {pdf_file_path}")
 
-        logger.info(f"PDF file located: {pdf_file_path}")
+        logger.info("PDF file located: %s", pdf_file_path)
 
         # Initialize Azure clients
         logger.info("Initializing Azure clients")
-        credential = AzureCliCredential()
-        project_client = AIProjectClient(endpoint=endpoint, credential=credential)
+        project_client = _get_project_client(endpoint)
 
         # Step 1: Upload PDF file
-        logger.info(f"Uploading {pdf_file_path.name} to Azure AI")
+        logger.info("Uploading %s to Azure AI", pdf_file_path.name)
         file = await project_client.agents.files.upload_and_poll(
             file_path=str(pdf_file_path), purpose="assistants"
         )
-        logger.info(f"File uploaded - ID: {file.id}")
+        logger.info("File uploaded - ID: %s", file.id)
 
         # Step 2: Create vector store
         logger.info("Creating vector store")
         vector_store = await project_client.agents.vector_stores.create_and_poll(
             file_ids=[file.id], name="airline_ops_knowledge_base"
         )
-        logger.info(f"Vector store created - ID: {vector_store.id}")
-
-        # Step 3: Build tools list
-        logger.info("Configuring tools")
-        all_tools = []
-
-        # Bing Search
-        if config.get("bing_search", {}).get("enabled", False):
-            bing_connection_id = os.getenv(
-                config["bing_search"].get("connection_id_env", "BING_CONNECTION_ID")
-            )
-            if bing_connection_id:
-                bing_tool = HostedWebSearchTool(
-                    name=config["bing_search"].get("name", "Bing Grounding Search"),
-                    description=config["bing_search"].get(
-                        "description", "Search the web for current information"
-                    ),
-                    connection_id=bing_connection_id,
-                )
-                all_tools.append(bing_tool)
-                logger.info("Bing Search tool added")
-
-        # Code Interpreter
-        code_interpreter = HostedCodeInterpreterTool(
-            name="Python Code Interpreter",
-            description="Execute Python code for calculations, data analysis, and problem solving",
-        )
-        all_tools.append(code_interpreter)
-        logger.info("Code Interpreter tool added")
-
-        # File Search with vector store
-        from agent_framework import HostedFileSearchTool
+        logger.info("Vector store created - ID: %s", vector_store.id)
 
+        # Step 3: Configure tools (Bing, Code Interpreter, weather, time are
+        # memoized in memory) plus File Search with the vector store
         file_search_tool = HostedFileSearchTool(vector_store_ids=[vector_store.id])
-        all_tools.append(file_search_tool)
-        logger.info(f"File Search tool added with vector store: {vector_store.id}")
-
-        # Custom function tools
-        all_tools.append(get_weather)
-        all_tools.append(get_time)
-        logger.info("Custom function tools added (weather, time)")
+        all_tools = [*_get_static_tools(config), file_search_tool]
+        logger.info("File Search tool added with vector store: %s", vector_store.id)
 
-        logger.info(f"Total tools configured: {len(all_tools)}")
+        logger.info("Total tools configured: %s", len(all_tools))
 
         # Step 4: Create Azure AI agent
-        logger.info(f"Creating Azure AI agent: {name}")
+        logger.info("Creating Azure AI agent: %s", name)
         azure_ai_agent = await project_client.agents.create_agent(
             model=model_deployment,
             name=name,
@@ -131,7 +334,7 @@ async def create_realtime_assistant() -> Tuple[ChatAgent, str, str, str]:
             tools=all_tools,
         )
         agent_id = azure_ai_agent.id
-        logger.info(f"Agent created - ID: {agent_id}")
+        logger.info("Agent created - ID: %s", agent_id)
 
         # Step 5: Create ChatAgent wrapper
         logger.info("Creating ChatAgent wrapper")
@@ -148,23 +351,30 @@ async def create_realtime_assistant() -> Tuple[ChatAgent, str, str, str]:
             user_approves_function_calls=False,
         )
 
-        logger.info("=" * 80)
-        logger.info("SUCCESS - Realtime Assistant created")
-        logger.info("=" * 80)
-        logger.info(f"Agent ID: {agent_id}")
-        logger.info(f"Vector Store ID: {vector_store.id}")
-        logger.info(f"File ID: {file.id}")
-        logger.info("=" * 80)
-        logger.info("Add these to your .env file:")
-        logger.info(f"REALTIME_ASSISTANT_AGENT_ID={agent_id}")
-        logger.info(f"FILE_SEARCH_VECTOR_STORE_ID={vector_store.id}")
-        logger.info(f"AIRLINE_OPS_FILE_ID={file.id}")
-        logger.info("=" * 80)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "\n".join(
+                    (
+                        _SEP,
+                        "SUCCESS - Realtime Assistant created",
+                        _SEP,
+                        f"Agent ID: {agent_id}",
+                        f"Vector Store ID: {vector_store.id}",
+                        f"File ID: {file.id}",
+                        _SEP,
+                        "Add these to your .env file:",
+                        f"REALTIME_ASSISTANT_AGENT_ID={agent_id}",
+                        f"FILE_SEARCH_VECTOR_STORE_ID={vector_store.id}",
+                        f"AIRLINE_OPS_FILE_ID={file.id}",
+                        _SEP,
+                    )
+                )
+            )
 
         return agent, agent_id, vector_store.id, file.id
 
     except Exception as e:
-        logger.error(f"Failed to create Realtime Assistant: {str(e)}")
+        logger.error("Failed to create Realtime Assistant: %s", e)
         raise
 
 
@@ -192,7 +402,7 @@ async def setup_realtime_assistant(
         logger.info("Connecting to existing Realtime Assistant agent")
 
         # Load configuration
-        config = load_agent_config("REALTIME_ASSISTANT")
+        config = _load_cfg("REALTIME_ASSISTANT")
 
         name = config["name"]
         description = config["description"]
@@ -203,7 +413,7 @@ async def setup_realtime_assistant(
         if not agent_id:
             agent_id = config["azure_ai_foundry"].get("agent_id")
         if not agent_id:
-            agent_id = os.getenv("REALTIME_ASSISTANT_AGENT_ID")
+            agent_id = _env().agent_id
 
         if not agent_id:
             raise ValueError(
@@ -211,27 +421,28 @@ async def setup_realtime_assistant(
                 "Run create_realtime_assistant() first to create the agent."
             )
 
-        logger.info(f"Agent ID: {agent_id}")
-
-        # Initialize Azure clients - ALWAYS use AzureCliCredential for Foundry agents
-        # This is critical: Foundry agents need Azure CLI scopes to execute function tools
-        logger.info(
-            "Creating AzureCliCredential for Foundry agent (required for function tool execution)"
-        )
-        credential = AzureCliCredential()
-
-        # Create AIProjectClient first (required for AzureAIAgentClient)
-        logger.info(f"Creating AIProjectClient with endpoint: {endpoint}")
-        from azure.ai.projects.aio import AIProjectClient
-
-        project_client = AIProjectClient(endpoint=endpoint, credential=credential)
-
-        # Connect to existing agent using project_client
-        logger.info(f"Connecting to agent: {agent_id}")
+        logger.info("Agent ID: %s", agent_id)
+
+        # Reuse the wrapper already connected on this loop; the agent's tools
+        # live on the remote agent and the config is read once per process
+        loop = asyncio.get_running_loop()
+        with _client_lock:
+            cached_agent = _connected_agents.get(loop, {}).get(agent_id)
+        if cached_agent is not None:
+            logger.info("Reusing connected Realtime Assistant: %s", agent_id)
+            return cached_agent
+
+        # Get AIProjectClient first (required for AzureAIAgentClient). It is
+        # authenticated with the shared AzureCliCredential - ALWAYS use it for
+        # Foundry agents: they need Azure CLI scopes to execute function tools
+        project_client = _get_project_client(endpoint)
+
+        # Connect to existing agent using project_client (it carries the auth,
+        # so no second credential is passed to the chat client)
+        logger.info("Connecting to agent: %s", agent_id)
         chat_client = AzureAIAgentClient(
             project_client=project_client,
             agent_id=agent_id,
-            credential=credential,
         )
 
         # Create ChatAgent wrapper with name and description (matching notebook pattern)
@@ -244,16 +455,48 @@ async def setup_realtime_assistant(
             instructions=instructions,  # Local instructions combine with remote agent instructions
         )
 
-        logger.info(f"Realtime Assistant '{name}' connected successfully")
+        with _client_lock:
+            agent = _connected_agents.setdefault(loop, {}).setdefault(agent_id, agent)
+
+        logger.info("Realtime Assistant '%s' connected successfully", name)
         logger.info("Agent connected - tools are configured on the remote agent")
 
         return agent
 
     except Exception as e:
-        logger.error(f"Failed to connect to Realtime Assistant: {str(e)}")
+        logger.error("Failed to connect to Realtime Assistant: %s", e)
         raise
 
 
+async def prewarm_realtime_assistant() -> None:
+    """
+    Warm the Realtime Assistant connection path before the first request.
+
+    Acquires a Foundry token and fetches the agent metadata concurrently, which
+    opens the pooled TLS connection and validates the agent ID. Best-effort:
+    failures are logged and never raised.
+
+    :return: None
+    """
+    try:
+        config = _load_cfg("REALTIME_ASSISTANT")
+        endpoint = config["azure_ai_foundry"]["endpoint"]
+        agent_id = config["azure_ai_foundry"].get("agent_id") or _env().agent_id
+
+        credential = _get_credential()
+        project_client = _get_project_client(endpoint)
+
+        warmups = [credential.get_token(PROJECT_TOKEN_SCOPE)]
+        if agent_id:
+            warmups.append(project_client.agents.get_agent(agent_id))
+        await asyncio.gather(*warmups)
+
+        logger.info("Realtime Assistant prewarmed")
+
+    except Exception as e:
+        logger.warning("Realtime Assistant prewarm failed: %s", e)
+
+
 async def delete_realtime_assistant(agent_id: str) -> None:
     """
     Delete the Realtime Assistant agent from Azure AI.
@@ -265,15 +508,17 @@ async def delete_realtime_assistant(agent_id: str) -> None:
     :raises: Exception if deletion fails
     """
     try:
-        config = load_agent_config("REALTIME_ASSISTANT")
+        config = _load_cfg("REALTIME_ASSISTANT")
         endpoint = config["azure_ai_foundry"]["endpoint"]
 
-        credential = AzureCliCredential()
-        project_client = AIProjectClient(endpoint=endpoint, credential=credential)
+        project_client = _get_project_client(endpoint)
 
         await project_client.agents.delete_agent(agent_id)
-        logger.info(f"Realtime Assistant agent deleted: {agent_id}")
+        with _client_lock:
+            for agents in _connected_agents.values():
+                agents.pop(agent_id, None)
+        logger.info("Realtime Assistant agent deleted: %s", agent_id)
 
     except Exception as e:
-        logger.error(f"Failed to delete agent {agent_id}: {str(e)}")
+        logger.error("Failed to delete agent %s: %s", agent_id, e)
         raise
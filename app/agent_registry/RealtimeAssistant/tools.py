@@ -5,8 +5,9 @@ Provides weather and time information tools with proper type annotations
 for Azure AI Agents integration.
 """
 
-from datetime import datetime, timezone
-from random import randint
+import logging
+import random
+import time
 from typing import Annotated
 
 from pydantic import Field
@@ -15,6 +16,15 @@ from utils.ml_logging import get_logger
 
 logger = get_logger("app.agent_registry.RealtimeAssistant.tools")
 
+_RNG = random.Random()
+CONDITIONS = ("sunny", "cloudy", "rainy", "stormy")
+# Highs range over 10-30°C inclusive
+_TEMPERATURE_MIN = 10
+_TEMPERATURE_SPAN = 21
+
+_WEATHER_TMPL = "The weather in {loc} is {cond} with a high of {t}°C.".format
+_TIME_TMPL = "The current UTC time is {}.".format
+
 
 def get_weather(
     location: Annotated[str, Field(description="The location to get the weather for.")],
@@ -28,13 +38,16 @@ def get_weather(
     :param location: The location to get weather information for
     :return: Weather description string
     """
-    logger.info(f"🌤️ get_weather called for: {location}")
-    conditions = ["sunny", "cloudy", "rainy", "stormy"]
-    temperature = randint(10, 30)
-    condition = conditions[randint(0, 3)]
+    logger.debug("🌤️ get_weather called for: %s", location)
+    # One draw covers both the condition and the temperature
+    r = _RNG.randrange(len(CONDITIONS) * _TEMPERATURE_SPAN)
+    temp_idx, cond_idx = divmod(r, len(CONDITIONS))
+    condition = CONDITIONS[cond_idx]
+    temperature = _TEMPERATURE_MIN + temp_idx
 
-    result = f"The weather in {location} is {condition} with a high of {temperature}°C."
-    logger.info(f"🌤️ Weather result: {result}")
+    result = _WEATHER_TMPL(loc=location, cond=condition, t=temperature)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🌤️ Weather result: %s", result)
     return result
 
 
@@ -46,8 +59,6 @@ def get_time() -> str:
 
     :return: Current UTC time string
     """
-    logger.info("🕐 get_time called")
-    current_time = datetime.now(timezone.utc)
-    result = f"The current UTC time is {current_time.strftime('%Y-%m-%d %H:%M:%S')}."
-    logger.info(f"🕐 Time result: {result}")
+    result = _TIME_TMPL(time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()))
+    logger.debug("🕐 Time result: %s", result)
     return result
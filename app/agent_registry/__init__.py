@@ -0,0 +1 @@
+# This file makes the agent_registry directory a Python package
@@ -5,21 +5,215 @@ This module provides utilities to load agent configurations from YAML files
 (locally or from URLs) and dynamically create agents based on those configurations.
 """
 
+import copy
+import functools
+import json
 import os
-from typing import Any, Dict, Optional
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from utils.ml_logging import get_logger
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
 logger = get_logger("agent_registry.config_loader")
 
+# Parsed local YAML configs are cached as JSON next to the source file
+# (set AGENT_CONFIG_JSON_CACHE=0 to disable, e.g. on read-only filesystems)
+CONFIG_CACHE_DIRNAME = ".cache"
+CONFIG_JSON_CACHE_ENABLED = os.getenv("AGENT_CONFIG_JSON_CACHE", "1").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+
+# libyaml-backed loader when available (much faster than the pure-Python one)
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+    logger.warning(
+        "PyYAML was built without libyaml; falling back to the slower pure-Python loader"
+    )
+
+# In-process parse cache: source -> (validator, config). The validator is the
+# file mtime for local sources and (ETag, Last-Modified) for URLs.
+_yaml_cache: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+# Remote config fetches: (connect, read) timeout so a stuck DNS lookup or
+# connect does not consume the whole read budget
+CONFIG_HTTP_TIMEOUT = (3, 10)
+# How long a resolved remote config is reused before it is revalidated
+REMOTE_CONFIG_REVALIDATE_SEC = 60.0
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Return the pooled requests session used for remote configs, retrying transient errors."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=16, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+        return _http_session
+
+
+def _parse_yaml(stream: Any) -> Dict[str, Any]:
+    """Parse YAML text, bytes or a file object with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_YAML_LOADER)
+
+
+def _sidecar_path(config_path: Path) -> Path:
+    """Return the JSON sidecar path for a local YAML config file."""
+    return config_path.parent / CONFIG_CACHE_DIRNAME / f"{config_path.stem}.json"
+
+
+def _load_local_config(config_source: str) -> Dict[str, Any]:
+    """
+    Load a local YAML config, reusing a JSON sidecar when the YAML is unchanged.
+
+    The sidecar stores the parsed config together with the source mtime; a
+    stale or unreadable sidecar falls back to parsing the YAML and rewriting it.
+
+    :param config_source: Local YAML file path
+    :return: Parsed configuration as dictionary
+    """
+    config_path = Path(config_source)
+    mtime_ns = config_path.stat().st_mtime_ns
+
+    with _yaml_cache_lock:
+        cached_entry = _yaml_cache.get(config_source)
+    if cached_entry is not None and cached_entry[0] == mtime_ns:
+        return cached_entry[1]
+
+    config = _load_local_config_uncached(config_path, mtime_ns)
+    with _yaml_cache_lock:
+        _yaml_cache[config_source] = (mtime_ns, config)
+    return config
+
+
+def _load_local_config_uncached(config_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Read the JSON sidecar if current, otherwise parse the YAML and rewrite it."""
+    if not CONFIG_JSON_CACHE_ENABLED:
+        with open(config_path, "r", encoding="utf-8") as f:
+            return _parse_yaml(f)
+
+    sidecar = _sidecar_path(config_path)
+
+    try:
+        cached = _json_loads(sidecar.read_bytes())
+        if cached.get("mtime_ns") == mtime_ns:
+            logger.info(f"Agent config loaded from cache: {sidecar}")
+            return cached["config"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = _parse_yaml(f)
+
+    try:
+        _write_sidecar(sidecar, _json_dumps({"mtime_ns": mtime_ns, "config": config}))
+    except (OSError, TypeError) as e:
+        logger.debug(f"Could not write config cache {sidecar}: {e}")
+
+    return config
+
+
+def _write_sidecar(sidecar: Path, payload: bytes) -> None:
+    """Atomically replace the sidecar so concurrent readers never see a partial file."""
+    sidecar.parent.mkdir(exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, sidecar)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _load_remote_config(url: str) -> Dict[str, Any]:
+    """
+    Fetch a YAML config over HTTP(S), revalidating a cached copy when possible.
+
+    Sends If-None-Match / If-Modified-Since from the previous response and
+    reuses the cached parse on 304 Not Modified.
+
+    :param url: HTTP(S) URL to the YAML config
+    :return: Parsed configuration as dictionary
+    """
+    with _yaml_cache_lock:
+        cached_entry = _yaml_cache.get(url)
+
+    headers = {}
+    if cached_entry is not None:
+        etag, last_modified = cached_entry[0]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = _get_http_session().get(
+        url, headers=headers, timeout=CONFIG_HTTP_TIMEOUT
+    )
+    if response.status_code == 304 and cached_entry is not None:
+        logger.info("Agent config not modified; using cached copy")
+        return cached_entry[1]
+
+    response.raise_for_status()
+    # libyaml decodes the raw bytes itself (honouring any BOM)
+    config = _parse_yaml(response.content)
+
+    validator = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    if any(validator):
+        with _yaml_cache_lock:
+            _yaml_cache[url] = (validator, config)
+    return config
+
 
 def load_yaml_config(config_source: str) -> Dict[str, Any]:
     """
     Load YAML configuration from a file path or URL.
 
+    Parses are cached in-process and revalidated by file mtime or HTTP
+    ETag/Last-Modified, so unchanged sources are not re-read or re-parsed.
+
     :param config_source: Local file path or HTTP(S) URL to YAML config
     :return: Parsed YAML configuration as dictionary
     :raises: Exception if loading or parsing fails
@@ -28,18 +222,16 @@ def load_yaml_config(config_source: str) -> Dict[str, Any]:
         # Check if source is a URL
         if config_source.startswith(("http://", "https://")):
             logger.info(f"Loading agent config from URL: {config_source}")
-            response = requests.get(config_source, timeout=10)
-            response.raise_for_status()
-            config = yaml.safe_load(response.text)
+            config = _load_remote_config(config_source)
             logger.info("Agent config loaded successfully from URL")
         else:
             # Load from local file
             logger.info(f"Loading agent config from file: {config_source}")
-            with open(config_source, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = _load_local_config(config_source)
             logger.info("Agent config loaded successfully from file")
 
-        return config
+        # Callers may mutate the result; keep the cached parse pristine
+        return copy.deepcopy(config)
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to load config from URL: {str(e)}")
@@ -55,6 +247,21 @@ def load_yaml_config(config_source: str) -> Dict[str, Any]:
         raise
 
 
+# Required fields, checked with one set difference by validate_agent_config
+REQUIRED_FIELDS: FrozenSet[str] = frozenset({"name", "description", "instructions"})
+# Model section -> (label used in errors, required fields)
+REQUIRED_SECTION_FIELDS: Dict[str, Tuple[str, FrozenSet[str]]] = {
+    "azure_openai": (
+        "Azure OpenAI",
+        frozenset({"endpoint_env", "api_key_env", "deployment_env"}),
+    ),
+    "azure_ai_foundry": (
+        "Azure AI Foundry",
+        frozenset({"endpoint_env", "model_deployment_env"}),
+    ),
+}
+
+
 def validate_agent_config(config: Dict[str, Any]) -> bool:
     """
     Validate that agent configuration contains required fields.
@@ -63,39 +270,28 @@ def validate_agent_config(config: Dict[str, Any]) -> bool:
     :return: True if valid, raises exception if invalid
     :raises: ValueError if configuration is invalid
     """
-    # Base required fields
-    required_fields = ["name", "description", "instructions"]
-
-    for field in required_fields:
-        if field not in config:
-            raise ValueError(f"Missing required field in agent config: {field}")
-
-    # Validate either azure_openai OR azure_ai_foundry section exists
-    has_azure_openai = "azure_openai" in config
-    has_azure_foundry = "azure_ai_foundry" in config
+    # Base required fields; report every missing one at once
+    missing = REQUIRED_FIELDS - config.keys()
+    if missing:
+        raise ValueError(
+            f"Missing required field(s) in agent config: {', '.join(sorted(missing))}"
+        )
 
-    if not has_azure_openai and not has_azure_foundry:
+    # Validate either azure_openai OR azure_ai_foundry section exists, and the
+    # required fields of each section that is present
+    sections = [section for section in REQUIRED_SECTION_FIELDS if section in config]
+    if not sections:
         raise ValueError(
             "Agent config must have either 'azure_openai' or 'azure_ai_foundry' section"
         )
 
-    # Validate azure_openai section if present
-    if has_azure_openai:
-        azure_config = config["azure_openai"]
-        required_azure_fields = ["endpoint_env", "api_key_env", "deployment_env"]
-
-        for field in required_azure_fields:
-            if field not in azure_config:
-                raise ValueError(f"Missing required Azure OpenAI field: {field}")
-
-    # Validate azure_ai_foundry section if present
-    if has_azure_foundry:
-        foundry_config = config["azure_ai_foundry"]
-        required_foundry_fields = ["endpoint_env", "model_deployment_env"]
-
-        for field in required_foundry_fields:
-            if field not in foundry_config:
-                raise ValueError(f"Missing required Azure AI Foundry field: {field}")
+    for section in sections:
+        label, required_fields = REQUIRED_SECTION_FIELDS[section]
+        missing = required_fields - config[section].keys()
+        if missing:
+            raise ValueError(
+                f"Missing required {label} field(s): {', '.join(sorted(missing))}"
+            )
 
     logger.info("Agent configuration validated successfully")
     return True
@@ -105,44 +301,38 @@ def resolve_env_variables(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Resolve environment variable references in configuration.
 
-    Recursively resolves any field with '_env' suffix by reading the environment
-    variable and creating a new field without the suffix.
+    Walks the config iteratively and resolves any field with '_env' suffix by
+    reading the environment variable and adding a field without the suffix.
+    The config is updated in place (the '_env' fields are kept for reference).
 
     :param config: Agent configuration with env variable references
-    :return: Configuration with resolved values
+    :return: The same configuration with resolved values
     """
-
-    def resolve_dict(d: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively resolve _env suffixed fields in a dictionary."""
-        resolved = {}
-        for key, value in d.items():
+    environ = os.environ
+    missing = []
+    stack = [config]
+    while stack:
+        d = stack.pop()
+        for key, value in list(d.items()):
             if isinstance(value, dict):
-                # Recursively resolve nested dictionaries
-                resolved[key] = resolve_dict(value)
-            elif key.endswith("_env") and isinstance(value, str):
-                # Resolve environment variable reference
-                env_var_name = value
-                env_value = os.getenv(env_var_name)
-
-                # Keep the _env field for reference
-                resolved[key] = value
-
-                # Add resolved field without _env suffix
-                field_name = key[:-4]  # Remove '_env' suffix
-                resolved[field_name] = env_value
-
-                # Log missing environment variables
+                stack.append(value)
+            elif key[-4:] == "_env" and isinstance(value, str):
+                env_value = environ.get(value)
+                d[key[:-4]] = env_value
                 if not env_value:
-                    logger.warning(f"Environment variable not set: {env_var_name}")
-            else:
-                # Keep other fields as-is
-                resolved[key] = value
+                    missing.append(value)
 
-        return resolved
+    # Log missing environment variables
+    if missing:
+        logger.warning(f"Environment variables not set: {', '.join(missing)}")
 
-    resolved_config = resolve_dict(config)
+    return config
 
-    return resolved_config
+
+@functools.lru_cache(maxsize=32)
+def _config_env_var_name(agent_name: str) -> str:
+    """Return the {AGENT_NAME}_CONFIG variable name for an agent."""
+    return f"{agent_name.upper()}_CONFIG"
 
 
 def get_config_location_from_env(agent_name: str) -> str:
@@ -156,7 +346,7 @@ def get_config_location_from_env(agent_name: str) -> str:
     :return: Configuration file path or URL
     :raises: ValueError if environment variable is not set
     """
-    env_var_name = f"{agent_name.upper()}_CONFIG"
+    env_var_name = _config_env_var_name(agent_name)
     config_location = os.getenv(env_var_name)
 
     if not config_location:
@@ -168,6 +358,37 @@ def get_config_location_from_env(agent_name: str) -> str:
     return config_location
 
 
+def _config_version(config_source: str) -> int:
+    """
+    Return the version key of a config for the resolved-config cache.
+
+    Local files are keyed on their mtime. URLs are keyed on a time bucket of
+    REMOTE_CONFIG_REVALIDATE_SEC, so a resolved remote config is reused for at
+    most that long before load_yaml_config revalidates it (ETag / 304).
+    """
+    if config_source.startswith(("http://", "https://")):
+        return int(time.monotonic() // REMOTE_CONFIG_REVALIDATE_SEC)
+    return os.stat(config_source).st_mtime_ns
+
+
+@functools.lru_cache(maxsize=32)
+def _load_agent_config_cached(
+    agent_name: str, config_source: str, version: int
+) -> Dict[str, Any]:
+    """Load, validate and resolve a config once per (agent_name, source, version)."""
+    # Load YAML configuration
+    config = load_yaml_config(config_source)
+
+    # Validate configuration structure
+    validate_agent_config(config)
+
+    # Resolve environment variables
+    resolved_config = resolve_env_variables(config)
+
+    logger.info(f"Agent config loaded successfully for: {agent_name}")
+    return resolved_config
+
+
 def load_agent_config(
     agent_name: str, config_source: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -177,6 +398,13 @@ def load_agent_config(
     If config_source is not provided, will look for environment variable
     {AGENT_NAME}_CONFIG to get the location.
 
+    Results are memoized per (agent_name, config_source) and, for local files,
+    the file mtime, so repeated calls skip the YAML read, parse and env
+    resolution while edits are still picked up. Remote configs are revalidated
+    against the server every REMOTE_CONFIG_REVALIDATE_SEC. Each caller
+    receives its own copy. Call load_agent_config.cache_clear() to force a
+    reload.
+
     :param agent_name: Name of the agent
     :param config_source: Optional path or URL to config file
     :return: Validated and resolved agent configuration
@@ -187,18 +415,22 @@ def load_agent_config(
         if not config_source:
             config_source = get_config_location_from_env(agent_name)
 
-        # Load YAML configuration
-        config = load_yaml_config(config_source)
-
-        # Validate configuration structure
-        validate_agent_config(config)
-
-        # Resolve environment variables
-        resolved_config = resolve_env_variables(config)
-
-        logger.info(f"Agent config loaded successfully for: {agent_name}")
-        return resolved_config
+        return copy.deepcopy(
+            _load_agent_config_cached(
+                agent_name, config_source, _config_version(config_source)
+            )
+        )
 
     except Exception as e:
         logger.error(f"Failed to load agent config for {agent_name}: {str(e)}")
         raise
+
+
+def _clear_yaml_cache() -> None:
+    """Drop every cached parse so the next load re-reads its source."""
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+
+
+load_yaml_config.cache_clear = _clear_yaml_cache  # type: ignore[attr-defined]
+load_agent_config.cache_clear = _load_agent_config_cached.cache_clear  # type: ignore[attr-defined]
@@ -0,0 +1,89 @@
+"""
+Chat history persistence.
+
+SQLite-backed store for chat messages keyed by a chat id, so a conversation
+survives app restarts and Streamlit only has to hold the messages that are
+actually on screen. Messages are appended one row at a time and read back a
+page at a time, newest first.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    chat_id TEXT NOT NULL,
+    message_id TEXT NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_chat ON messages (chat_id, seq);
+"""
+
+
+class ChatHistoryStore:
+    """
+    Append-only message log shared by every session in the process.
+
+    - append: store one message at the end of a chat.
+    - load_page: read up to ``limit`` messages older than a given message.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def append(self, chat_id: str, message: Dict[str, str]) -> None:
+        """
+        Store a message at the end of a chat.
+
+        :param chat_id: Conversation the message belongs to
+        :param message: Chat message with "id", "role" and "content"
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO messages (chat_id, message_id, role, content) "
+                "VALUES (?, ?, ?, ?)",
+                (chat_id, message["id"], message["role"], message["content"]),
+            )
+
+    def load_page(
+        self, chat_id: str, limit: Optional[int], before: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], bool]:
+        """
+        Return a page of messages in chronological order.
+
+        :param chat_id: Conversation to read
+        :param limit: Maximum number of messages (None reads the whole chat)
+        :param before: Only return messages older than this message id
+        :return: The messages and whether older ones remain
+        """
+        query = "SELECT message_id, role, content FROM messages WHERE chat_id = ?"
+        params: list = [chat_id]
+        if before is not None:
+            query += (
+                " AND seq < (SELECT seq FROM messages"
+                " WHERE chat_id = ? AND message_id = ?)"
+            )
+            params += [chat_id, before]
+        query += " ORDER BY seq DESC"
+        if limit is not None:
+            # One extra row tells whether another page exists
+            query += " LIMIT ?"
+            params.append(limit + 1)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        has_older = limit is not None and len(rows) > limit
+        rows = rows[:limit] if has_older else rows
+        messages = [
+            {"id": message_id, "role": role, "content": content}
+            for message_id, role, content in reversed(rows)
+        ]
+        return messages, has_older
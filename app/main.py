@@ -1,29 +1,91 @@
 """Airline Operations Assistant - Streamlit UI."""
 
 import asyncio
+import concurrent.futures
 import os
+import sqlite3
 import sys
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, Optional
 
 import streamlit as st
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# Streamlit runs this file as a script; make the project root importable once
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 from settings import (
     APP_SUBTITLE,
     APP_TITLE,
     CHAT_CONTAINER_HEIGHT,
+    CHAT_HISTORY_PERSIST,
+    CHAT_HISTORY_WINDOW,
     CHAT_INPUT_PLACEHOLDER,
+    CHAT_STREAM_RENDER_MODE,
     PAGE_TITLE,
+    STREAM_RENDER_INTERVAL_SEC,
     validate_configuration,
 )
 
-from app.agent_registry.AirlineIntelligentAssistant.main import (
-    setup_airline_intelligent_assistant,
-)
+from app.chat_store import ChatHistoryStore
+from app.runtime import AsyncRuntime
 from utils.ml_logging import get_logger
 
 logger = get_logger("app.main")
 
+# Single-user persistent sign-in (AZURE_AUTH_PERSIST=1): the MSAL token cache
+# and the signed-in account are kept on disk so restarts skip the browser
+AUTH_PERSIST_ENABLED = os.getenv("AZURE_AUTH_PERSIST", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+AUTH_TOKEN_CACHE_NAME = "airline_ops_assistant"
+AUTH_RECORD_PATH = Path(_PROJECT_ROOT) / ".cache" / "auth_record.json"
+CHAT_HISTORY_DB_PATH = Path(_PROJECT_ROOT) / ".cache" / "chat_history.db"
+
+
+def _create_azure_credential():
+    """
+    Create the interactive credential for a new session.
+
+    With AZURE_AUTH_PERSIST set, tokens are stored in the OS-protected MSAL
+    cache and the signed-in account is remembered in AUTH_RECORD_PATH, so a
+    restarted app signs in silently. Every session then shares that account,
+    which is why this is opt-in and meant for single-user local runs.
+    """
+    from azure.identity import InteractiveBrowserCredential
+
+    if not AUTH_PERSIST_ENABLED:
+        return InteractiveBrowserCredential()
+
+    from azure.identity import AuthenticationRecord, TokenCachePersistenceOptions
+
+    from src.agents.dataagents.main import FABRIC_SCOPE
+
+    cache_options = TokenCachePersistenceOptions(name=AUTH_TOKEN_CACHE_NAME)
+    try:
+        record = AuthenticationRecord.deserialize(
+            AUTH_RECORD_PATH.read_text(encoding="utf-8")
+        )
+        return InteractiveBrowserCredential(
+            cache_persistence_options=cache_options, authentication_record=record
+        )
+    except (OSError, ValueError, KeyError):
+        pass
+
+    credential = InteractiveBrowserCredential(cache_persistence_options=cache_options)
+    record = credential.authenticate(scopes=[FABRIC_SCOPE])
+    try:
+        AUTH_RECORD_PATH.parent.mkdir(exist_ok=True)
+        AUTH_RECORD_PATH.write_text(record.serialize(), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not save authentication record: {e}")
+    return credential
+
 
 def setup_environment():
     """Initialize session state and validate config."""
@@ -31,111 +93,331 @@ def setup_environment():
         st.error("Missing required environment variables. Check your .env file.")
         st.stop()
 
-    if "azure_credential" not in st.session_state:
-        try:
-            from azure.identity import InteractiveBrowserCredential
+    if "chat_history" not in st.session_state:
+        _load_chat_history()
+
+    if "conversation_thread" not in st.session_state:
+        st.session_state.conversation_thread = None
+
+
+@st.cache_resource(show_spinner=False)
+def get_chat_store() -> Optional[ChatHistoryStore]:
+    """Return the process-wide chat history store, or None when persistence is off."""
+    if not CHAT_HISTORY_PERSIST:
+        return None
+    try:
+        return ChatHistoryStore(CHAT_HISTORY_DB_PATH)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Chat history persistence disabled: {e}")
+        return None
+
+
+def _chat_id() -> str:
+    """Return this tab's chat id, kept in the URL so a reload reopens the chat."""
+    chat_id = st.query_params.get("chat")
+    if not chat_id:
+        chat_id = uuid.uuid4().hex
+        st.query_params["chat"] = chat_id
+    return chat_id
+
+
+def _load_chat_history() -> None:
+    """
+    Start the session's chat history.
+
+    With persistence on, only the most recent CHAT_HISTORY_WINDOW messages
+    are loaded; older pages are read on demand by render_chat_history. The
+    agent's conversation thread is not restored, so a reopened chat starts
+    with fresh model context.
+    """
+    state = st.session_state
+    state.chat_history = []
+    store = get_chat_store()
+    if store is None:
+        return
+
+    state.chat_id = _chat_id()
+    try:
+        history, has_older = store.load_page(state.chat_id, CHAT_HISTORY_WINDOW or None)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not load chat history: {e}")
+        return
+    state.chat_history = history
+    state.chat_history_has_older = has_older
+
+
+def _load_older_messages(count: int) -> None:
+    """Prepend up to count older messages from the store to the chat history."""
+    state = st.session_state
+    store = get_chat_store()
+    if store is None or not state.chat_history:
+        return
+    try:
+        older, has_older = store.load_page(
+            state.chat_id, count, before=state.chat_history[0]["id"]
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not load earlier chat messages: {e}")
+        return
+    state.chat_history = older + state.chat_history
+    state.chat_history_has_older = has_older
+
+
+def _append_message(message: Dict[str, str]) -> None:
+    """Add a message to the chat history, persisting it when enabled."""
+    st.session_state.chat_history.append(message)
+    store = get_chat_store()
+    if store is None:
+        return
+    try:
+        store.append(st.session_state.chat_id, message)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not save chat message: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def get_runtime() -> AsyncRuntime:
+    """Return the process-wide event loop that owns the agents and their clients."""
+    return AsyncRuntime()
+
+
+@st.cache_resource(show_spinner=False)
+def _agent_future() -> concurrent.futures.Future:
+    """
+    Start building the orchestrator once per process on the shared runtime loop.
+
+    The agent holds no per-user state: each session passes its own
+    conversation thread and credential at query time.
+    """
+    logger.info("Initializing agent...")
+    return get_runtime().submit(_build_agent())
+
+
+async def _build_agent():
+    """Build the orchestrator, importing the agent SDKs on the runtime thread."""
+    from app.agent_registry.AirlineIntelligentAssistant.main import (
+        setup_airline_intelligent_assistant,
+    )
+
+    return await setup_airline_intelligent_assistant()
 
-            st.session_state.azure_credential = InteractiveBrowserCredential()
+
+async def prewarm_session(credential) -> None:
+    """Warm the Fabric and Foundry tokens and connections for a session."""
+    from app.agent_registry.AirlineOpsContext import main as ops_context_module
+    from app.agent_registry.RealtimeAssistant.main import prewarm_realtime_assistant
+
+    await asyncio.gather(
+        prewarm_realtime_assistant(),
+        ops_context_module.prewarm_fabric_agent(credential),
+    )
+
+
+def start_agent_setup() -> None:
+    """
+    Kick off agent setup and token warm-up for this session without waiting.
+
+    The page renders while the shared agent is built; the first query waits
+    for it in get_session_agent.
+    """
+    state = st.session_state
+    if "agent" in state or "session_prewarm" in state:
+        return
+
+    if "azure_credential" not in state:
+        try:
+            state.azure_credential = _create_azure_credential()
         except Exception as e:
             logger.error(f"Failed to create Azure credential: {e}")
             st.error("Failed to initialize Azure authentication.")
             st.stop()
 
-    if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+    from app.agent_registry.AirlineOpsContext import main as ops_context_module
 
-    if "conversation_thread" not in st.session_state:
-        st.session_state.conversation_thread = None
+    # Process-wide fallback credential (and the Fabric endpoint) for the tools
+    ops_context_module.set_azure_credential(state.azure_credential)
+    state.session_prewarm = get_runtime().submit(
+        prewarm_session(state.azure_credential)
+    )
+    _agent_future()
 
 
-async def setup_agent():
-    """Initialize the agent (once per session)."""
-    if "agent" not in st.session_state:
-        try:
-            logger.info("Initializing agent...")
+def get_session_agent():
+    """Return the agent for this session, waiting for background setup if needed."""
+    state = st.session_state
+    agent = state.get("agent")
+    if agent is not None:
+        return agent
 
-            from app.agent_registry.AirlineOpsContext import main as ops_context_module
-
-            ops_context_module.set_azure_credential(st.session_state.azure_credential)
+    try:
+        agent = _agent_future().result()
+    except Exception as e:
+        # Forget the failed build so the next query starts a fresh one
+        _agent_future.clear()
+        logger.error(f"Agent initialization failed: {e}")
+        raise RuntimeError(f"Agent initialization failed: {e}") from e
 
-            agent = await setup_airline_intelligent_assistant(
-                credential=st.session_state.azure_credential
-            )
-            st.session_state.agent = agent
-            logger.info("Agent ready")
-        except Exception as e:
-            logger.error(f"Agent initialization failed: {e}")
-            raise
+    state.agent = agent
+    logger.info("Agent ready")
+    return agent
 
 
-async def process_query(query: str) -> str:
-    """Process a user query and return the response."""
-    logger.info("=" * 80)
-    logger.info("🚀 NEW QUERY RECEIVED")
-    logger.info(f"📋 Query: {query}")
-    logger.info("=" * 80)
+async def stream_query(agent, thread, credential, query: str) -> AsyncIterator[str]:
+    """Process a user query, yielding response text as the orchestrator produces it."""
+    logger.info("🚀 New query (%d chars): %s", len(query), query)
 
-    agent = st.session_state.get("agent")
-    if not agent:
-        raise RuntimeError("Agent not initialized")
+    # Bind this session's identity to the tool calls below; the agent is
+    # shared by every Streamlit session in the process
+    from app.agent_registry.AirlineOpsContext import main as ops_context_module
 
-    if st.session_state.conversation_thread is None:
-        logger.info("Creating new conversation thread")
-        st.session_state.conversation_thread = agent.get_new_thread()
+    ops_context_module.use_azure_credential(credential)
 
     try:
-        logger.info("🤖 Sending to orchestrator (AirlineIntelligentAssistant)...")
-        result = await agent.run(query, thread=st.session_state.conversation_thread)
-        response = result.text if hasattr(result, "text") else str(result)
-        logger.info("=" * 80)
-        logger.info(f"✅ RESPONSE COMPLETE ({len(response)} chars)")
-        logger.info("=" * 80)
-        return response
+        response_chars = 0
+        async for update in agent.run_stream(query, thread=thread):
+            text = update.text
+            if text:
+                response_chars += len(text)
+                yield text
+        logger.info("✅ Response complete (%d chars)", response_chars)
     except Exception as e:
         logger.error(f"Query failed: {e}")
         raise
 
 
+def iterate_session_query(query: str) -> Iterator[str]:
+    """Stream this session's answer to a query from the shared runtime loop."""
+    state = st.session_state
+    agent = get_session_agent()
+
+    thread = state.conversation_thread
+    if thread is None:
+        logger.info("Creating new conversation thread")
+        thread = state.conversation_thread = agent.get_new_thread()
+
+    return get_runtime().iterate(
+        stream_query(agent, thread, state.azure_credential, query)
+    )
+
+
+def _render_markdown(target, content: str) -> None:
+    """
+    Render chat content as markdown, allowing raw HTML only when it has tags.
+
+    Plain replies (the common case) skip the raw-HTML path entirely.
+
+    :param target: st or a placeholder exposing .markdown
+    :param content: Message text to render
+    """
+    target.markdown(content, unsafe_allow_html="<" in content)
+
+
+def render_stream(placeholder, chunks: Iterator[str]) -> str:
+    """
+    Render a streamed answer into a placeholder and return the full text.
+
+    Updates are throttled to STREAM_RENDER_INTERVAL_SEC so long replies don't
+    re-render the whole message for every token; in "strong" mode the partial
+    answer is shown as plain text. The final answer is always rendered once
+    as markdown.
+    """
+    render_partial = (
+        placeholder.text
+        if CHAT_STREAM_RENDER_MODE == "strong"
+        else lambda text: _render_markdown(placeholder, text)
+    )
+    parts = []
+    dirty = False
+    last_render = time.monotonic()
+    for chunk in chunks:
+        parts.append(chunk)
+        dirty = True
+        now = time.monotonic()
+        if now - last_render >= STREAM_RENDER_INTERVAL_SEC:
+            render_partial("".join(parts))
+            last_render = now
+            dirty = False
+
+    response = "".join(parts)
+    if dirty or CHAT_STREAM_RENDER_MODE == "strong":
+        _render_markdown(placeholder, response)
+    return response
+
+
 def render_chat_history(chat_container):
-    """Render conversation history."""
-    if "chat_history" not in st.session_state:
+    """
+    Render conversation history.
+
+    Only the last CHAT_HISTORY_WINDOW messages are rendered on each rerun;
+    a button loads older ones a window at a time (reading them from the chat
+    store when persistence is on), so long sessions don't re-render the
+    whole conversation on every interaction.
+    """
+    state = st.session_state
+    if "chat_history" not in state:
         return
 
-    for msg in st.session_state.chat_history:
+    history = state.chat_history
+    window = state.get("chat_history_window", CHAT_HISTORY_WINDOW)
+    has_older = state.get("chat_history_has_older", False)
+    if CHAT_HISTORY_WINDOW > 0 and (len(history) > window or has_older):
+        hidden = len(history) - window
+        label = (
+            f"Show {min(hidden, CHAT_HISTORY_WINDOW)} earlier messages"
+            if hidden >= CHAT_HISTORY_WINDOW or not has_older
+            else "Show earlier messages"
+        )
+        if st.button(label, key="show_earlier_messages"):
+            window += CHAT_HISTORY_WINDOW
+            state.chat_history_window = window
+            if has_older and len(history) < window:
+                _load_older_messages(window - len(history))
+                history = state.chat_history
+        history = history[-window:]
+
+    for msg in history:
         role = msg["role"].lower()
         content = msg["content"]
 
-        if role == "user":
-            with st.chat_message("user", avatar="🧑‍💻"):
-                st.markdown(content, unsafe_allow_html=True)
-        elif role == "assistant":
-            with st.chat_message("assistant", avatar="🤖"):
-                st.markdown(content, unsafe_allow_html=True)
+        # Keyed rows keep their identity when the window shifts
+        with st.container(key=msg["id"]):
+            if role == "user":
+                with st.chat_message("user", avatar="🧑‍💻"):
+                    _render_markdown(st, content)
+            elif role == "assistant":
+                with st.chat_message("assistant", avatar="🤖"):
+                    _render_markdown(st, content)
+
+
+def _new_message_id() -> str:
+    """Return a stable element key for a chat message."""
+    return f"msg-{uuid.uuid4().hex}"
+
+
+# Built once at import; the header is static for the life of the process
+_HEADER_HTML = f"""
+<style>
+.header {{
+    text-align: center;
+    background: linear-gradient(145deg, #1F6095, #008AD7);
+    color: white;
+    padding: 30px;
+    border-radius: 10px;
+    margin-bottom: 20px;
+}}
+.header h1 {{ margin: 0; font-size: 1.8rem; }}
+.header p {{ margin: 5px 0 0; opacity: 0.9; }}
+</style>
+<div class="header">
+    <h1>{APP_TITLE}</h1>
+    <p>{APP_SUBTITLE}</p>
+</div>
+"""
 
 
 def render_header():
     """Render the app header."""
-    st.markdown(
-        f"""
-        <style>
-        .header {{
-            text-align: center;
-            background: linear-gradient(145deg, #1F6095, #008AD7);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-        }}
-        .header h1 {{ margin: 0; font-size: 1.8rem; }}
-        .header p {{ margin: 5px 0 0; opacity: 0.9; }}
-        </style>
-        <div class="header">
-            <h1>{APP_TITLE}</h1>
-            <p>{APP_SUBTITLE}</p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 
 def main():
@@ -143,13 +425,6 @@ def main():
     st.set_page_config(page_title=PAGE_TITLE)
     setup_environment()
 
-    try:
-        asyncio.run(setup_agent())
-    except Exception as e:
-        logger.error(f"Failed to initialize agent: {e}")
-        st.error(f"Agent initialization failed: {e}")
-        st.stop()
-
     render_header()
 
     user_input = st.chat_input(CHAT_INPUT_PLACEHOLDER)
@@ -158,21 +433,39 @@ def main():
     with chat_container:
         render_chat_history(chat_container)
 
-        if user_input:
-            st.session_state.chat_history.append(
-                {"role": "user", "content": user_input}
-            )
-            with st.chat_message("user", avatar="🧑‍💻"):
-                st.markdown(user_input)
+    # The Azure and agent SDKs are only imported once the page has painted;
+    # agent setup then runs in the background and the first query waits for it
+    start_agent_setup()
 
-            with st.spinner("Processing..."):
+    if user_input:
+        with chat_container:
+            user_message_id = _new_message_id()
+            _append_message(
+                {"id": user_message_id, "role": "user", "content": user_input}
+            )
+            with st.container(key=user_message_id):
+                with st.chat_message("user", avatar="🧑‍💻"):
+                    st.markdown(user_input)
+
+            # Render the answer as it streams in under the key it keeps in the
+            # history; only the final text is stored
+            assistant_message_id = _new_message_id()
+            with st.container(key=assistant_message_id), st.chat_message(
+                "assistant", avatar="🤖"
+            ):
+                placeholder = st.empty()
                 try:
-                    result = asyncio.run(process_query(user_input))
-                    st.session_state.chat_history.append(
-                        {"role": "assistant", "content": result}
+                    with st.spinner("Processing..."):
+                        response = render_stream(
+                            placeholder, iterate_session_query(user_input)
+                        )
+                    _append_message(
+                        {
+                            "id": assistant_message_id,
+                            "role": "assistant",
+                            "content": response,
+                        }
                     )
-                    with st.chat_message("assistant", avatar="🤖"):
-                        st.markdown(result, unsafe_allow_html=True)
                 except Exception as e:
                     logger.error(f"Error processing query: {e}")
                     st.error(f"Something went wrong: {e}")
@@ -0,0 +1,83 @@
+"""
+Background event loop shared by every Streamlit session in the process.
+
+Streamlit runs each script on its own thread, and calling asyncio.run there
+creates and tears down a fresh loop every time. Agents and their pooled
+clients are bound to the loop they were created on, so they are kept on one
+long-lived loop instead and driven from script threads through this runtime.
+"""
+
+import asyncio
+import concurrent.futures
+import queue
+import threading
+from typing import AsyncIterator, Awaitable, Iterator, TypeVar
+
+try:
+    import uvloop
+
+    # Only the runtime's own loop uses uvloop; the global event loop policy
+    # (shared with the Streamlit server) is left alone
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+T = TypeVar("T")
+
+# Marks the end of a bridged async stream
+_DONE = object()
+
+
+class AsyncRuntime:
+    """
+    Event loop running forever on a daemon thread.
+
+    - submit: schedule a coroutine on the loop and return its future.
+    - iterate: consume an async iterator on the loop, yielding items to the
+      calling (sync) thread as they are produced.
+    """
+
+    def __init__(self, name: str = "agent-runtime") -> None:
+        self.loop = _new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the runtime loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def iterate(self, items: AsyncIterator[T]) -> Iterator[T]:
+        """
+        Yield the items of an async iterator produced on the runtime loop.
+
+        The iterator is consumed by a single task, so context variables set
+        inside it stay visible for the whole stream. Stopping early cancels
+        that task.
+        """
+        results: "queue.Queue[tuple]" = queue.Queue()
+
+        async def pump() -> None:
+            error = None
+            try:
+                async for item in items:
+                    results.put((item, None))
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                # Always release the consumer, even if the stream is cancelled
+                results.put((_DONE, error))
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self.loop)
+        try:
+            while True:
+                item, error = results.get()
+                if error is not None:
+                    raise error
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            future.cancel()
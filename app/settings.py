@@ -1,5 +1,6 @@
 """Configuration settings for the Airline Operations Assistant."""
 
+import functools
 import os
 
 from utils.ml_logging import get_logger
@@ -28,6 +29,24 @@ APP_TITLE = "Airline Operations Assistant"
 APP_SUBTITLE = "Powered by Azure AI Foundry + Fabric"
 CHAT_CONTAINER_HEIGHT = 500
 CHAT_INPUT_PLACEHOLDER = "Ask about flights, weather, operations..."
+# Number of most recent chat messages rendered per rerun (older ones load on demand)
+CHAT_HISTORY_WINDOW = int(os.getenv("CHAT_HISTORY_WINDOW", "50"))
+# Keep chat messages on disk (CHAT_HISTORY_PERSIST=1) so reloads and restarts
+# reopen the conversation; only the current window is loaded into the session
+CHAT_HISTORY_PERSIST = os.getenv("CHAT_HISTORY_PERSIST", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Streaming render mode for answers in progress:
+#   off      - re-render markdown on every streamed chunk
+#   balanced - re-render markdown at most every STREAM_RENDER_INTERVAL_SEC
+#   strong   - show plain text at a slower cadence, parse markdown once at the end
+CHAT_STREAM_RENDER_MODE = os.getenv("CHAT_STREAM_RENDER_MODE", "balanced").lower()
+STREAM_RENDER_INTERVAL_SEC = {"off": 0.0, "balanced": 0.05, "strong": 0.15}.get(
+    CHAT_STREAM_RENDER_MODE, 0.05
+)
 
 REQUIRED_VARS = [
     "AZURE_AI_PROJECT_ENDPOINT",
@@ -37,8 +56,15 @@ REQUIRED_VARS = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def validate_configuration() -> bool:
-    """Check that required environment variables are set."""
+    """
+    Check that required environment variables are set.
+
+    The result is cached for the process: the settings above are read once at
+    import, so re-checking the environment on every Streamlit rerun cannot
+    change anything without a restart.
+    """
     missing = [var for var in REQUIRED_VARS if not os.getenv(var)]
     if missing:
         logger.error(f"Missing required environment variables: {', '.join(missing)}")
@@ -0,0 +1 @@
+# This file makes the agents directory a Python package
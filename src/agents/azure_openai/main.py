@@ -1,3 +1,5 @@
+import functools
+
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureOpenAIChatClient
 
@@ -6,6 +8,30 @@ from utils.ml_logging import get_logger
 logger = get_logger("agent_registry.azure_openai.main")
 
 
+@functools.lru_cache(maxsize=8)
+def get_aoai_chat_client(
+    endpoint: str, api_key: str, deployment_name: str
+) -> AzureOpenAIChatClient:
+    """
+    Return a shared Azure OpenAI chat client for the given endpoint and deployment.
+
+    Agents pointing at the same resource reuse one underlying AsyncAzureOpenAI
+    client and therefore one HTTP connection pool, so only the first agent pays
+    for DNS resolution and the TLS handshake.
+
+    :param endpoint: Azure OpenAI endpoint URL
+    :param api_key: Azure OpenAI API key for authentication
+    :param deployment_name: Azure OpenAI model deployment name
+    :return: Cached AzureOpenAIChatClient instance
+    """
+    logger.info(f"Creating Azure OpenAI chat client for deployment '{deployment_name}'")
+    return AzureOpenAIChatClient(
+        endpoint=endpoint,
+        api_key=api_key,
+        deployment_name=deployment_name,
+    )
+
+
 def setup_aoai_agent(
     name: str,
     endpoint: str,
@@ -19,7 +45,8 @@ def setup_aoai_agent(
     Initialize an Azure OpenAI ChatAgent with specified configuration.
 
     This function creates a ChatAgent configured with the provided tools,
-    instructions, and Azure OpenAI endpoint settings.
+    instructions, and Azure OpenAI endpoint settings. The chat client is
+    shared across agents using the same endpoint, key and deployment.
 
     :param name: Agent name identifier
     :param endpoint: Azure OpenAI endpoint URL
@@ -33,11 +60,7 @@ def setup_aoai_agent(
     """
     try:
         agent = ChatAgent(
-            chat_client=AzureOpenAIChatClient(
-                endpoint=endpoint,
-                api_key=api_key,
-                deployment_name=deployment_name,
-            ),
+            chat_client=get_aoai_chat_client(endpoint, api_key, deployment_name),
             name=f"{name}Agent",
             description=description,
             instructions=instructions,
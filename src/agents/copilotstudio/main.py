@@ -9,12 +9,6 @@ are handled in the azure_openai.fabric module instead.
 
 import os
 
-# Configure logging
-import sys
-
-# Microsoft Agent Framework for Copilot Studio integration
-
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 from utils.ml_logging import get_logger
 
 logger = get_logger("agent_registry.copilotstudio")
@@ -3,20 +3,25 @@ Fabric Agent Management Module
 Handles Fabric Data agents
 """
 
+import asyncio
+import atexit
+import functools
+import inspect
 import os
-import sys
+import random
+import threading
 import time
 import typing as t
 import uuid
+import weakref
+from collections import OrderedDict
 
-from azure.identity import DefaultAzureCredential
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from openai._models import FinalRequestOptions
 from openai._types import Omit
 from openai._utils import is_given
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
-
 from utils.ml_logging import get_logger
 
 logger = get_logger("src.agents.dataagents")
@@ -26,21 +31,302 @@ FABRIC_SCOPE_ALTERNATIVE: str = "https://analysis.windows.net/powerbi/api/.defau
 FABRIC_API_VERSION: str = "2024-05-01-preview"
 DEFAULT_POLL_INTERVAL_SEC: int = 2
 DEFAULT_TIMEOUT_SEC: int = 300
+# Refresh cached bearer tokens this long before they expire
+TOKEN_REFRESH_MARGIN_SEC: int = 300
+# Maximum Fabric runs in flight per batch call
+DEFAULT_MAX_CONCURRENCY: int = 8
+# Newest-first page size when reading a thread's reply
+MESSAGES_PAGE_LIMIT: int = 20
+# Poll backoff starts here so short runs are picked up quickly, then grows
+# (with jitter) up to the poll interval
+FIRST_POLL_DELAY_SEC: float = 0.25
+# Stream run events instead of polling (set FABRIC_RUN_STREAMING=1 for
+# Fabric endpoints that accept stream=True on runs)
+FABRIC_RUN_STREAMING: bool = os.getenv("FABRIC_RUN_STREAMING", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Per-credential entries (tokens, assistant ids, async clients) kept per map;
+# each Streamlit session brings its own credential, so these must stay bounded
+CREDENTIAL_CACHE_MAX: int = 32
+FABRIC_MAX_CONNECTIONS: int = 64
+FABRIC_MAX_KEEPALIVE_CONNECTIONS: int = 32
+
+try:
+    import h2  # noqa: F401
+
+    # Multiplex Fabric calls over one connection per host when h2 is installed
+    FABRIC_HTTP2: bool = True
+except ImportError:
+    FABRIC_HTTP2 = False
 
 _cached_credential = None
 
+# Bearer tokens of sync credentials keyed by (id(credential), scope), stored as
+# (credential, token). The credential is kept with its token so a recycled id()
+# never serves another credential's token. Async credentials (e.g. the tools'
+# CachedTokenCredential) cache their own tokens and are not stored here.
+_token_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_token_lock = threading.Lock()
+
+# One pooled AsyncClient per event loop (connections cannot be shared across loops)
+_async_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# AsyncFabricOpenAI clients per event loop, keyed by (endpoint, id(credential)),
+# least recently used first
+_async_fabric_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Shared assistant ids keyed by (base_url, id(credential)). Assistants live on
+# the server, so unlike clients they outlive event loops and are reused by
+# every client for the same endpoint and identity.
+_assistant_ids: "OrderedDict[tuple, tuple]" = OrderedDict()
+_assistant_ids_lock = threading.Lock()
+# Pooled sync client for ask_fabric_agent, created on first use
+_sync_http_client: t.Optional[httpx.Client] = None
+# FabricOpenAI clients keyed by (endpoint, id(credential)), least recently used first
+_sync_fabric_clients: "OrderedDict[tuple, FabricOpenAI]" = OrderedDict()
+_sync_fabric_lock = threading.Lock()
+SYNC_FABRIC_CLIENTS_MAX: int = 32
+
+
+def _lru_store(
+    cache: OrderedDict, key: t.Hashable, value: t.Any, maxsize: int
+) -> None:
+    """Store value as the most recently used entry, evicting the oldest past maxsize."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=32)
+def _bearer_headers(access_token: str) -> t.Mapping[str, str]:
+    """Return the prebuilt Authorization header for an access token."""
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+def _cached_token(credential, scope: str = FABRIC_SCOPE):
+    """Return the cached token for credential and scope if not close to expiry."""
+    entry = _token_cache.get((id(credential), scope))
+    if entry is None or entry[0] is not credential:
+        return None
+    if entry[1].expires_on - time.time() > TOKEN_REFRESH_MARGIN_SEC:
+        return entry[1]
+    return None
+
+
+def _get_auth_headers(credential=None) -> t.Mapping[str, str]:
+    """Get the bearer auth headers, reusing the cached token until it nears expiry"""
+    credential = credential or _cached_credential
+    token = _cached_token(credential)
+    if token is None:
+        with _token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            token = _cached_token(credential)
+            if token is None:
+                token = credential.get_token(FABRIC_SCOPE)
+                _lru_store(
+                    _token_cache,
+                    (id(credential), FABRIC_SCOPE),
+                    (credential, token),
+                    CREDENTIAL_CACHE_MAX,
+                )
+    return _bearer_headers(token.token)
+
+
+async def _aget_auth_headers(credential=None) -> t.Mapping[str, str]:
+    """Get the bearer auth headers without blocking the event loop."""
+    credential = credential or _cached_credential
+    get_token = credential.get_token
+    if inspect.iscoroutinefunction(get_token):
+        # Async credentials manage their own token cache and refresh
+        return _bearer_headers((await get_token(FABRIC_SCOPE)).token)
+    # Sync azure-identity credentials may hit the network; keep them off the loop
+    return await asyncio.to_thread(_get_auth_headers, credential)
+
+
+def _http_client_kwargs() -> dict:
+    """Pool, timeout and HTTP/2 settings shared by the sync and async clients."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=FABRIC_MAX_CONNECTIONS,
+            max_keepalive_connections=FABRIC_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        "timeout": httpx.Timeout(60.0, connect=10.0),
+        "http2": FABRIC_HTTP2,
+    }
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Return the keep-alive HTTP client shared by Fabric calls on this event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(**_http_client_kwargs())
+        _async_http_clients[loop] = client
+    return client
+
 
-def _get_bearer() -> str:
-    """Get fresh bearer token for each request"""
+def _get_async_fabric_client(endpoint: str, credential) -> "AsyncFabricOpenAI":
+    """Return the AsyncFabricOpenAI client for this endpoint and credential on the running loop."""
+    loop = asyncio.get_running_loop()
+    clients = _async_fabric_clients.setdefault(loop, OrderedDict())
+    key = (endpoint, id(credential))
+    client = clients.get(key)
+    if client is None or client.is_closed() or client.credential is not credential:
+        client = AsyncFabricOpenAI(
+            base_url=endpoint,
+            credential=credential,
+            http_client=_get_async_http_client(),
+        )
+    # Evicted clients share the loop's HTTP pool, so there is nothing to close
+    _lru_store(clients, key, client, CREDENTIAL_CACHE_MAX)
+    return client
+
+
+def _get_sync_http_client() -> httpx.Client:
+    """Return the keep-alive HTTP client shared by sync Fabric calls."""
+    global _sync_http_client
+    if _sync_http_client is None or _sync_http_client.is_closed:
+        _sync_http_client = httpx.Client(**_http_client_kwargs())
+        atexit.register(_sync_http_client.close)
+    return _sync_http_client
+
+
+def _get_sync_fabric_client(endpoint: str, credential) -> "FabricOpenAI":
+    """Return the FabricOpenAI client for this endpoint and credential, reusing its assistant."""
+    key = (endpoint, id(credential))
+    with _sync_fabric_lock:
+        client = _sync_fabric_clients.get(key)
+        if client is None or client.credential is not credential:
+            client = FabricOpenAI(
+                base_url=endpoint,
+                credential=credential,
+                http_client=_get_sync_http_client(),
+            )
+        _lru_store(_sync_fabric_clients, key, client, SYNC_FABRIC_CLIENTS_MAX)
+    return client
+
+
+def _known_assistant_id(client) -> t.Optional[str]:
+    """Return the assistant id already created for this client's endpoint and credential."""
+    key = (str(client.base_url), id(client.credential))
+    with _assistant_ids_lock:
+        entry = _assistant_ids.get(key)
+        if entry is None or entry[0] is not client.credential:
+            return None
+        _assistant_ids.move_to_end(key)
+        return entry[1]
+
+
+def _remember_assistant_id(client, assistant_id: str) -> None:
+    """Record the assistant id for this client's endpoint and credential."""
+    key = (str(client.base_url), id(client.credential))
+    with _assistant_ids_lock:
+        _lru_store(
+            _assistant_ids, key, (client.credential, assistant_id), CREDENTIAL_CACHE_MAX
+        )
+
+
+def _next_poll_delay(prev_delay: float, poll_interval_sec: float) -> float:
+    """
+    Decorrelated-jitter backoff for run polling.
+
+    Delays start at FIRST_POLL_DELAY_SEC, so quick runs are not held back a
+    full poll interval, and grow randomly up to 3x the previous delay, capped
+    at poll_interval_sec. Long runs are therefore never polled less often than
+    with a fixed interval, and the jitter keeps concurrent runs from polling
+    Fabric in lockstep.
+
+    :param prev_delay: Previous sleep duration in seconds
+    :param poll_interval_sec: Maximum sleep between status polls
+    :return: Next sleep duration in seconds
+    """
+    floor = min(FIRST_POLL_DELAY_SEC, poll_interval_sec)
+    return min(poll_interval_sec, random.uniform(floor, prev_delay * 3))
+
+
+def _set_cached_credential(credential=None):
+    """Cache the credential used by the Fabric clients, creating one if needed."""
     global _cached_credential
-    return _cached_credential.get_token(FABRIC_SCOPE).token
+    if credential is None:
+        # Deferred: azure.identity is only needed when no credential is passed in
+        from azure.identity import DefaultAzureCredential
+
+        logger.info("🔐 Creating new Azure credential...")
+        credential = DefaultAzureCredential()
+    else:
+        logger.info("♻️  Reusing cached Azure credential")
+    _cached_credential = credential
+    return credential
+
+
+def _reply_messages(messages_desc) -> list:
+    """
+    Return the assistant messages after the latest user turn, oldest first.
+
+    :param messages_desc: Thread messages ordered newest first
+    """
+    reply = []
+    for m in messages_desc:
+        if m.role == "user":
+            break
+        if m.role == "assistant":
+            reply.append(m)
+    reply.reverse()
+    return reply
+
+
+# Default headers for every Fabric request; per-request headers override them
+_BASE_HEADERS: t.Final = {"Accept": "application/json"}
+
+
+def _fabric_headers(
+    options: FinalRequestOptions, extra: t.Optional[t.Mapping[str, str]] = None
+) -> dict:
+    """
+    Build request headers from the base template, request headers and extras.
+
+    Extras (e.g. Authorization) win over request headers; an ActivityId is
+    generated unless the request already carries one.
+    """
+    headers: dict[str, str | Omit] = _BASE_HEADERS.copy()
+    if is_given(options.headers):
+        headers.update(options.headers)
+    if extra:
+        headers.update(extra)
+    if "ActivityId" not in headers:
+        headers["ActivityId"] = str(uuid.uuid4())
+    return headers
+
+
+def _extract_assistant_text(messages) -> str:
+    """Join the text content of assistant messages from a Fabric thread."""
+    return (
+        "\n".join(
+            c.text.value
+            for m in messages
+            if m.role == "assistant"
+            for c in m.content
+            if c.type == "text"
+        ).strip()
+        or "[No text content returned]"
+    )
 
 
 class FabricOpenAI(OpenAI):
     def __init__(
-        self, base_url: str, api_version: str = "2024-05-01-preview", **kwargs: t.Any
+        self,
+        base_url: str,
+        api_version: str = "2024-05-01-preview",
+        credential=None,
+        **kwargs: t.Any,
     ) -> None:
         self.api_version = api_version
+        # Per-client credential; falls back to the module-level one when None
+        self.credential = credential
+        # Shared "not-used" assistant, created on first run (see get_assistant_id)
+        self._assistant_id: t.Optional[str] = None
+        self._assistant_lock = threading.Lock()
         default_query = kwargs.pop("default_query", {})
         default_query["api-version"] = self.api_version
         super().__init__(
@@ -50,17 +336,54 @@ class FabricOpenAI(OpenAI):
             **kwargs,
         )
 
+    def get_assistant_id(self) -> str:
+        """Return the id of this client's shared Fabric assistant, creating it once."""
+        with self._assistant_lock:
+            if self._assistant_id is None:
+                self._assistant_id = _known_assistant_id(self)
+            if self._assistant_id is None:
+                self._assistant_id = self.beta.assistants.create(model="not-used").id
+                _remember_assistant_id(self, self._assistant_id)
+            return self._assistant_id
+
     def _prepare_options(self, options: FinalRequestOptions) -> None:
-        headers: dict[str, str | Omit] = (
-            {**options.headers} if is_given(options.headers) else {}
-        )
-        headers["Authorization"] = f"Bearer {_get_bearer()}"
-        headers.setdefault("Accept", "application/json")
-        headers.setdefault("ActivityId", str(uuid.uuid4()))
-        options.headers = headers
+        options.headers = _fabric_headers(options, _get_auth_headers(self.credential))
         return super()._prepare_options(options)
 
 
+class AsyncFabricOpenAI(AsyncOpenAI):
+    """Async counterpart of FabricOpenAI for use inside the agent event loop."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_version: str = FABRIC_API_VERSION,
+        credential=None,
+        **kwargs: t.Any,
+    ) -> None:
+        self.api_version = api_version
+        # Per-client credential; falls back to the module-level one when None
+        self.credential = credential
+        # Shared "not-used" assistant, created on first run (see _get_assistant_id)
+        self._assistant_task: t.Optional[asyncio.Future] = None
+        default_query = kwargs.pop("default_query", {})
+        default_query["api-version"] = self.api_version
+        super().__init__(
+            api_key="",
+            base_url=base_url,
+            default_query=default_query,
+            **kwargs,
+        )
+
+    async def _prepare_options(
+        self, options: FinalRequestOptions
+    ) -> FinalRequestOptions:
+        options.headers = _fabric_headers(
+            options, await _aget_auth_headers(self.credential)
+        )
+        return await super()._prepare_options(options)
+
+
 class DataAgent(OpenAI):
     """
     OpenAI client wrapper for Microsoft Fabric Data Agents.
@@ -94,14 +417,29 @@ class DataAgent(OpenAI):
         Args:
             options: Request options to be modified with auth headers
         """
-        headers = {**options.headers} if is_given(options.headers) else {}
-        headers.update(self._auth_headers)
-        headers.setdefault("Accept", "application/json")
-        headers.setdefault("ActivityId", str(uuid.uuid4()))
-        options.headers = headers
+        options.headers = _fabric_headers(options, self._auth_headers)
         return super()._prepare_options(options)
 
 
+def _stream_run_reply(
+    client: FabricOpenAI, thread_id: str, assistant_id: str, timeout_sec: int
+) -> str:
+    """Run a thread through runs.stream and join the completed assistant messages."""
+    deadline = time.monotonic() + timeout_sec
+    messages = []
+    with client.beta.threads.runs.stream(
+        thread_id=thread_id, assistant_id=assistant_id, timeout=timeout_sec
+    ) as stream:
+        for event in stream:
+            if event.event == "thread.message.completed":
+                messages.append(event.data)
+            elif event.event in _RUN_END_EVENTS:
+                return f"[Run ended: {event.data.status}]"
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Run streaming exceeded {timeout_sec}s")
+    return _extract_assistant_text(messages)
+
+
 def ask_fabric_agent(
     endpoint: str,
     question: str,
@@ -112,18 +450,13 @@ def ask_fabric_agent(
     try:
         logger.info(f"🔍 Querying Fabric agent at endpoint: {endpoint}")
 
-        global _cached_credential
-        if credential is None:
-            logger.info("🔐 Creating new Azure credential...")
-            credential = DefaultAzureCredential()
-            _cached_credential = credential
-        else:
-            logger.info("♻️  Reusing cached Azure credential")
-            _cached_credential = credential
+        credential = _set_cached_credential(credential)
 
-        client = FabricOpenAI(base_url=endpoint)
-
-        assistant = client.beta.assistants.create(model="not-used")
+        # The client and its assistant are reused across calls; each question
+        # still gets its own short-lived thread so concurrent calls never
+        # collide on a thread with an active run
+        client = _get_sync_fabric_client(endpoint, credential)
+        assistant_id = client.get_assistant_id()
         thread = client.beta.threads.create()
 
         try:
@@ -131,16 +464,24 @@ def ask_fabric_agent(
                 thread_id=thread.id, role="user", content=question
             )
 
+            if FABRIC_RUN_STREAMING:
+                response = _stream_run_reply(
+                    client, thread.id, assistant_id, timeout_sec
+                )
+                logger.info("Fabric agent query completed successfully")
+                return response
+
             run = client.beta.threads.runs.create(
-                thread_id=thread.id, assistant_id=assistant.id
+                thread_id=thread.id, assistant_id=assistant_id
             )
 
-            terminal = {"completed", "failed", "cancelled", "requires_action"}
             start = time.time()
-            while run.status not in terminal:
+            delay = min(FIRST_POLL_DELAY_SEC, poll_interval_sec)
+            while run.status not in _TERMINAL_RUN_STATUSES:
                 if time.time() - start > timeout_sec:
                     raise TimeoutError(f"Run polling exceeded {timeout_sec}s")
-                time.sleep(poll_interval_sec)
+                delay = _next_poll_delay(delay, poll_interval_sec)
+                time.sleep(delay)
                 run = client.beta.threads.runs.retrieve(
                     thread_id=thread.id, run_id=run.id
                 )
@@ -149,15 +490,10 @@ def ask_fabric_agent(
                 return f"[Run ended: {run.status}]"
 
             # Extract response
-            msgs = client.beta.threads.messages.list(thread_id=thread.id, order="asc")
-            out_chunks = []
-            for m in msgs.data:
-                if m.role == "assistant":
-                    for c in m.content:
-                        if getattr(c, "type", None) == "text":
-                            out_chunks.append(c.text.value)
-
-            response = "\n".join(out_chunks).strip() or "[No text content returned]"
+            msgs = client.beta.threads.messages.list(
+                thread_id=thread.id, order="desc", limit=MESSAGES_PAGE_LIMIT
+            )
+            response = _extract_assistant_text(_reply_messages(msgs.data))
             logger.info("Fabric agent query completed successfully")
             return response
 
@@ -171,3 +507,376 @@ def ask_fabric_agent(
         error_msg = f"Error querying Fabric agent: {str(e)}"
         logger.error(error_msg)
         return error_msg
+
+
+class FabricRunEndedError(Exception):
+    """Raised when a Fabric run finishes in a non-completed state."""
+
+    def __init__(self, status: str) -> None:
+        super().__init__(f"Fabric run ended with status: {status}")
+        self.status = status
+
+
+def _message_text(message) -> str:
+    """Join the text content parts of a single thread message."""
+    return "\n".join(c.text.value for c in message.content if c.type == "text")
+
+
+async def _get_assistant_id(client: AsyncFabricOpenAI) -> str:
+    """
+    Return the id of the client's shared Fabric assistant, creating it once.
+
+    The data agent ignores the assistant's model and instructions, so one
+    assistant serves every thread for the endpoint and credential, including
+    on clients created later for other event loops. Concurrent callers share
+    a single creation request; a failed creation is retried on the next call.
+    """
+    assistant_id = _known_assistant_id(client)
+    if assistant_id is not None:
+        return assistant_id
+
+    task = client._assistant_task
+    if task is None or (
+        task.done() and (task.cancelled() or task.exception() is not None)
+    ):
+        task = asyncio.ensure_future(client.beta.assistants.create(model="not-used"))
+        client._assistant_task = task
+    assistant_id = (await asyncio.shield(task)).id
+    _remember_assistant_id(client, assistant_id)
+    return assistant_id
+
+
+async def aprewarm_fabric_agent(endpoint: str, credential=None) -> None:
+    """
+    Create the shared Fabric assistant for an endpoint ahead of the first question.
+
+    The assistant id is kept process-wide, so later queries (on any event
+    loop) skip the assistants.create round trip. Best-effort: failures are
+    logged and never raised.
+
+    :param endpoint: Fabric data agent OpenAI-compatible endpoint
+    :param credential: Azure credential (sync or async); DefaultAzureCredential if None
+    """
+    try:
+        credential = _set_cached_credential(credential)
+        client = _get_async_fabric_client(endpoint, credential)
+        await _get_assistant_id(client)
+        logger.info(f"Fabric assistant prewarmed for endpoint: {endpoint}")
+    except Exception as e:
+        logger.warning(f"Fabric assistant prewarm failed: {e}")
+
+
+_TERMINAL_RUN_STATUSES = frozenset(
+    {"completed", "failed", "cancelled", "expired", "incomplete", "requires_action"}
+)
+_RUN_END_EVENTS = frozenset(
+    {
+        "thread.run.failed",
+        "thread.run.cancelled",
+        "thread.run.expired",
+        "thread.run.incomplete",
+        "thread.run.requires_action",
+    }
+)
+
+
+async def _apoll_run_text(
+    client: AsyncFabricOpenAI,
+    thread_id: str,
+    assistant_id: str,
+    poll_interval_sec: int,
+    timeout_sec: int,
+    incremental: bool = False,
+) -> t.AsyncIterator[str]:
+    """
+    Start a run and poll it, yielding its assistant messages.
+
+    Messages are listed once the run reaches a terminal state. With
+    incremental set, they are also listed after every status poll so each
+    message is yielded as soon as it completes, at the cost of one extra
+    request per poll.
+
+    :raises FabricRunEndedError: If the run ends failed, cancelled, etc.
+    """
+    run = await client.beta.threads.runs.create(
+        thread_id=thread_id, assistant_id=assistant_id
+    )
+
+    seen: set[str] = set()
+    start = time.monotonic()
+    delay = min(FIRST_POLL_DELAY_SEC, poll_interval_sec)
+    polled = False
+    while True:
+        finished = run.status in _TERMINAL_RUN_STATUSES
+        if finished and run.status != "completed":
+            raise FabricRunEndedError(run.status)
+
+        if finished or (incremental and polled):
+            # Only the reply to this question is needed: read newest first and
+            # stop at the user turn instead of listing the whole thread
+            msgs = await client.beta.threads.messages.list(
+                thread_id=thread_id, order="desc", limit=MESSAGES_PAGE_LIMIT
+            )
+            for m in _reply_messages(msgs.data):
+                if m.id in seen:
+                    continue
+                if not finished and getattr(m, "status", None) != "completed":
+                    continue
+                seen.add(m.id)
+                text = _message_text(m)
+                if text:
+                    yield text
+
+        if finished:
+            return
+
+        if time.monotonic() - start > timeout_sec:
+            raise TimeoutError(f"Run polling exceeded {timeout_sec}s")
+        delay = _next_poll_delay(delay, poll_interval_sec)
+        await asyncio.sleep(delay)
+        run = await client.beta.threads.runs.retrieve(
+            thread_id=thread_id, run_id=run.id
+        )
+        polled = True
+
+
+async def _astream_run_events(
+    client: AsyncFabricOpenAI,
+    thread_id: str,
+    assistant_id: str,
+    timeout_sec: int,
+) -> t.AsyncIterator[str]:
+    """
+    Start a streaming run and yield each assistant message when it completes.
+
+    Messages arrive as the server pushes them, so there is no poll-interval
+    delay between the run finishing and the answer being returned.
+
+    :raises FabricRunEndedError: If the run ends failed, cancelled, etc.
+    """
+    deadline = time.monotonic() + timeout_sec
+    async with client.beta.threads.runs.stream(
+        thread_id=thread_id, assistant_id=assistant_id, timeout=timeout_sec
+    ) as stream:
+        async for event in stream:
+            if event.event == "thread.message.completed":
+                if event.data.role == "assistant":
+                    text = _message_text(event.data)
+                    if text:
+                        yield text
+            elif event.event in _RUN_END_EVENTS:
+                raise FabricRunEndedError(event.data.status)
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Run streaming exceeded {timeout_sec}s")
+
+
+async def _astream_run_text(
+    client: AsyncFabricOpenAI,
+    question: str,
+    poll_interval_sec: int,
+    timeout_sec: int,
+    incremental: bool = False,
+) -> t.AsyncIterator[str]:
+    """
+    Run one question on its own thread and yield its assistant text.
+
+    The thread and message are created while the shared assistant is still
+    being resolved. The run is then streamed when FABRIC_RUN_STREAMING is set,
+    yielding each assistant message as it completes. Otherwise it is polled,
+    and messages are read once the run ends, or on every poll if incremental.
+
+    :raises FabricRunEndedError: If the run ends failed, cancelled, etc.
+    """
+    assistant_id_task = asyncio.ensure_future(_get_assistant_id(client))
+    try:
+        thread = await client.beta.threads.create()
+    except BaseException:
+        assistant_id_task.cancel()
+        raise
+
+    try:
+        await client.beta.threads.messages.create(
+            thread_id=thread.id, role="user", content=question
+        )
+
+        assistant_id = await assistant_id_task
+        if FABRIC_RUN_STREAMING:
+            texts = _astream_run_events(client, thread.id, assistant_id, timeout_sec)
+        else:
+            texts = _apoll_run_text(
+                client,
+                thread.id,
+                assistant_id,
+                poll_interval_sec,
+                timeout_sec,
+                incremental=incremental,
+            )
+        try:
+            async for text in texts:
+                yield text
+        finally:
+            # Release the event stream if the caller stops reading early
+            await texts.aclose()
+
+    finally:
+        if not assistant_id_task.done():
+            assistant_id_task.cancel()
+        try:
+            await client.beta.threads.delete(thread_id=thread.id)
+        except Exception:
+            pass
+
+
+async def _arun_fabric_question(
+    client: AsyncFabricOpenAI,
+    question: str,
+    poll_interval_sec: int,
+    timeout_sec: int,
+) -> str:
+    """Run one question against the client's Fabric assistant and buffer the answer."""
+    out_chunks = []
+    try:
+        async for chunk in _astream_run_text(
+            client, question, poll_interval_sec, timeout_sec
+        ):
+            out_chunks.append(chunk)
+    except FabricRunEndedError as e:
+        return f"[Run ended: {e.status}]"
+    return "\n".join(out_chunks).strip() or "[No text content returned]"
+
+
+async def astream_fabric_agent(
+    endpoint: str,
+    question: str,
+    credential=None,
+    poll_interval_sec: int = DEFAULT_POLL_INTERVAL_SEC,
+    timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+) -> t.AsyncIterator[str]:
+    """
+    Stream a Fabric data agent answer as assistant messages complete.
+
+    Useful for callers that can render partial results (e.g. a UI) instead of
+    waiting for the whole run. Errors are yielded as a final message string,
+    matching aask_fabric_agent.
+
+    :param endpoint: Fabric data agent OpenAI-compatible endpoint
+    :param question: Natural language question for the data agent
+    :param credential: Azure credential (sync or async); DefaultAzureCredential if None
+    :param poll_interval_sec: Seconds between run status polls
+    :param timeout_sec: Maximum seconds to wait for the run to finish
+    :return: Async iterator of response text chunks
+    """
+    try:
+        logger.info(f"🔍 Streaming Fabric agent response from endpoint: {endpoint}")
+
+        credential = _set_cached_credential(credential)
+
+        client = _get_async_fabric_client(endpoint, credential)
+
+        async for chunk in _astream_run_text(
+            client, question, poll_interval_sec, timeout_sec, incremental=True
+        ):
+            yield chunk
+
+    except FabricRunEndedError as e:
+        yield f"[Run ended: {e.status}]"
+    except Exception as e:
+        error_msg = f"Error querying Fabric agent: {str(e)}"
+        logger.error(error_msg)
+        yield error_msg
+
+
+async def aask_fabric_agent(
+    endpoint: str,
+    question: str,
+    credential=None,
+    poll_interval_sec: int = DEFAULT_POLL_INTERVAL_SEC,
+    timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+) -> str:
+    """
+    Async variant of ask_fabric_agent that never blocks the event loop.
+
+    Requests go through a pooled httpx.AsyncClient shared per event loop, so
+    connections and TLS sessions are reused across calls, and polling waits
+    with asyncio.sleep instead of time.sleep.
+
+    :param endpoint: Fabric data agent OpenAI-compatible endpoint
+    :param question: Natural language question for the data agent
+    :param credential: Azure credential (sync or async); DefaultAzureCredential if None
+    :param poll_interval_sec: Seconds between run status polls
+    :param timeout_sec: Maximum seconds to wait for the run to finish
+    :return: Assistant response text, or an error message string
+    """
+    responses = await aask_fabric_agent_batch(
+        endpoint,
+        [question],
+        credential=credential,
+        poll_interval_sec=poll_interval_sec,
+        timeout_sec=timeout_sec,
+    )
+    return responses[0]
+
+
+async def aask_fabric_agent_batch(
+    endpoint: str,
+    questions: t.Sequence[str],
+    credential=None,
+    poll_interval_sec: int = DEFAULT_POLL_INTERVAL_SEC,
+    timeout_sec: int = DEFAULT_TIMEOUT_SEC,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[str]:
+    """
+    Answer several questions with one client and its shared Fabric assistant.
+
+    The Fabric data agent has no multi-question API, so each question still
+    gets its own thread and run, but the assistant handshake is paid once and
+    up to max_concurrency runs are polled concurrently, so large batches
+    (e.g. evaluation sets) don't flood the endpoint.
+
+    :param endpoint: Fabric data agent OpenAI-compatible endpoint
+    :param questions: Natural language questions for the data agent
+    :param credential: Azure credential (sync or async); DefaultAzureCredential if None
+    :param poll_interval_sec: Seconds between run status polls
+    :param timeout_sec: Maximum seconds to wait for each run to finish
+    :param max_concurrency: Maximum number of runs in flight at once
+    :return: One response (or error message string) per question, in order
+    """
+    try:
+        logger.info(
+            f"🔍 Querying Fabric agent at endpoint: {endpoint} "
+            f"({len(questions)} question(s))"
+        )
+
+        credential = _set_cached_credential(credential)
+
+        client = _get_async_fabric_client(endpoint, credential)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(question: str) -> str:
+            async with semaphore:
+                return await _arun_fabric_question(
+                    client, question, poll_interval_sec, timeout_sec
+                )
+
+        results = await asyncio.gather(
+            *[run_one(question) for question in questions],
+            return_exceptions=True,
+        )
+
+    except Exception as e:
+        error_msg = f"Error querying Fabric agent: {str(e)}"
+        logger.error(error_msg)
+        return [error_msg] * len(questions)
+
+    responses = []
+    for result in results:
+        if isinstance(result, BaseException):
+            error_msg = f"Error querying Fabric agent: {str(result)}"
+            logger.error(error_msg)
+            responses.append(error_msg)
+        else:
+            responses.append(result)
+
+    logger.info("Fabric agent query completed successfully")
+    return responses
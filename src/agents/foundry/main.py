@@ -5,17 +5,95 @@ This module provides utilities to create and manage Azure AI Foundry agents,
 handling agent creation, ID persistence, and agent reuse patterns.
 """
 
-from typing import Callable, List, Optional
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional
 
 from agent_framework import ChatAgent
 from agent_framework.azure import AzureAIAgentClient
-from azure.ai.projects import AIProjectClient
-from azure.identity import AzureCliCredential
 
 from utils.ml_logging import get_logger
 
 logger = get_logger("src.agents.foundry.main")
 
+# Seconds before an `az account get-access-token` call is abandoned
+AZURE_CLI_PROCESS_TIMEOUT_SEC = 10
+
+# One AzureCliCredential per process; it caches tokens, so sharing it avoids
+# shelling out to the Azure CLI for every agent setup
+_credential: Optional[Any] = None
+# One AIProjectClient per endpoint on each event loop (aio transports cannot be
+# shared across loops)
+_project_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]"
+) = weakref.WeakKeyDictionary()
+_client_lock = threading.Lock()
+
+
+def _get_credential() -> Any:
+    """Return the shared async AzureCliCredential, creating it on first use."""
+    global _credential
+    with _client_lock:
+        if _credential is None:
+            from azure.identity.aio import AzureCliCredential
+
+            _credential = AzureCliCredential(
+                process_timeout=AZURE_CLI_PROCESS_TIMEOUT_SEC
+            )
+        return _credential
+
+
+def _get_project_client(endpoint: str):
+    """
+    Return the cached async AIProjectClient for this endpoint on the running loop.
+
+    The async client is used throughout: agent creation and deletion are
+    awaited, and AzureAIAgentClient drives the project client from the event
+    loop. Reusing it avoids a new CLI token exchange and TLS handshake on
+    every setup or delete. The Azure SDK imports are deferred to first use so
+    importing this module stays cheap for sessions that never touch a Foundry
+    agent.
+
+    :param endpoint: Azure AI Project endpoint URL
+    :return: Shared AIProjectClient for the endpoint
+    """
+    from azure.ai.projects.aio import AIProjectClient
+
+    credential = _get_credential()
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        clients = _project_clients.setdefault(loop, {})
+        client = clients.get(endpoint)
+        if client is None:
+            logger.info(f"Creating AIProjectClient with endpoint: {endpoint}")
+            client = AIProjectClient(endpoint=endpoint, credential=credential)
+            clients[endpoint] = client
+        return client
+
+
+async def aclose_clients() -> None:
+    """
+    Close the project clients cached for the running event loop.
+
+    The shared credential is left open for clients on other loops; close it
+    with aclose_credential at process shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        clients = _project_clients.pop(loop, {})
+    for client in clients.values():
+        await client.close()
+
+
+async def aclose_credential() -> None:
+    """Close the shared AzureCliCredential. Call once, at process shutdown."""
+    global _credential
+    with _client_lock:
+        credential, _credential = _credential, None
+    if credential is not None:
+        await credential.close()
+
 
 async def setup_foundry_agent(
     name: str,
@@ -44,9 +122,8 @@ async def setup_foundry_agent(
     :raises: Exception if agent creation fails
     """
     try:
-        # Initialize Azure AI Project Client
-        credential = AzureCliCredential()
-        project_client = AIProjectClient(endpoint=endpoint, credential=credential)
+        # Shared Azure AI Project Client for this endpoint
+        project_client = _get_project_client(endpoint)
 
         # If agent_id provided, reuse existing agent
         if agent_id:
@@ -101,9 +178,7 @@ async def delete_foundry_agent(endpoint: str, agent_id: str) -> None:
     :raises: Exception if agent deletion fails
     """
     try:
-        credential = AzureCliCredential()
-        project_client = AIProjectClient(endpoint=endpoint, credential=credential)
-
+        project_client = _get_project_client(endpoint)
         await project_client.agents.delete_agent(agent_id)
         logger.info(f"Foundry agent deleted successfully: {agent_id}")
 
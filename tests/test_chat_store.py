@@ -0,0 +1,60 @@
+"""Tests for the SQLite chat history store."""
+
+import pytest
+
+from app.chat_store import ChatHistoryStore
+
+
+def _message(i: int) -> dict:
+    return {"id": f"m{i}", "role": "user" if i % 2 else "assistant", "content": f"#{i}"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ChatHistoryStore(tmp_path / "history" / "chat.db")
+
+
+def test_load_page_returns_latest_messages_in_order(store):
+    for i in range(5):
+        store.append("chat", _message(i))
+
+    messages, has_older = store.load_page("chat", limit=3)
+
+    assert [m["id"] for m in messages] == ["m2", "m3", "m4"]
+    assert messages[-1] == _message(4)
+    assert has_older
+
+
+def test_load_page_pages_backwards_until_exhausted(store):
+    for i in range(5):
+        store.append("chat", _message(i))
+
+    older, has_older = store.load_page("chat", limit=3, before="m2")
+    assert [m["id"] for m in older] == ["m0", "m1"]
+    assert not has_older
+
+
+def test_load_page_without_limit_reads_whole_chat(store):
+    for i in range(3):
+        store.append("chat", _message(i))
+
+    messages, has_older = store.load_page("chat", limit=None)
+    assert [m["id"] for m in messages] == ["m0", "m1", "m2"]
+    assert not has_older
+
+
+def test_chats_are_isolated(store):
+    store.append("a", _message(0))
+    store.append("b", _message(1))
+
+    messages, _ = store.load_page("a", limit=10)
+    assert [m["id"] for m in messages] == ["m0"]
+    assert store.load_page("missing", limit=10) == ([], False)
+
+
+def test_history_survives_reopening(tmp_path):
+    path = tmp_path / "chat.db"
+    ChatHistoryStore(path).append("chat", _message(0))
+
+    messages, _ = ChatHistoryStore(path).load_page("chat", limit=10)
+    assert messages == [_message(0)]
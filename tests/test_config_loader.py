@@ -0,0 +1,178 @@
+"""Tests for the parse caches of the agent config loader."""
+
+import os
+
+import pytest
+
+pytest.importorskip("requests")
+
+from app.agent_registry import config_loader  # noqa: E402
+from app.agent_registry.config_loader import (  # noqa: E402
+    _sidecar_path,
+    load_agent_config,
+    load_yaml_config,
+)
+
+CONFIG_YAML = """\
+name: {name}
+description: Test agent
+instructions: Be brief.
+azure_openai:
+  endpoint_env: TEST_AOAI_ENDPOINT
+  api_key_env: TEST_AOAI_KEY
+  deployment_env: TEST_AOAI_DEPLOYMENT
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_caches(monkeypatch):
+    # Exercise the in-process cache on its own; sidecar tests opt back in
+    monkeypatch.setattr(config_loader, "CONFIG_JSON_CACHE_ENABLED", False)
+    load_yaml_config.cache_clear()
+    load_agent_config.cache_clear()
+    yield
+    load_yaml_config.cache_clear()
+    load_agent_config.cache_clear()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "conf.yaml"
+    path.write_text(CONFIG_YAML.format(name="First"), encoding="utf-8")
+    return path
+
+
+def _rewrite(path, name):
+    """Change the config and bump its mtime so the change is always visible."""
+    stat = path.stat()
+    path.write_text(CONFIG_YAML.format(name=name), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    parse = config_loader._parse_yaml
+
+    def counting(stream):
+        calls.append(stream)
+        return parse(stream)
+
+    monkeypatch.setattr(config_loader, "_parse_yaml", counting)
+    return calls
+
+
+def test_unchanged_file_is_parsed_once(config_file, monkeypatch):
+    parses = _count_parses(monkeypatch)
+
+    first = load_yaml_config(str(config_file))
+    second = load_yaml_config(str(config_file))
+
+    assert first == second
+    assert len(parses) == 1
+
+
+def test_callers_get_independent_copies(config_file):
+    first = load_yaml_config(str(config_file))
+    first["name"] = "mutated"
+    assert load_yaml_config(str(config_file))["name"] == "First"
+
+
+def test_modified_file_is_reparsed(config_file):
+    assert load_yaml_config(str(config_file))["name"] == "First"
+    _rewrite(config_file, "Second")
+    assert load_yaml_config(str(config_file))["name"] == "Second"
+
+
+@pytest.fixture
+def sidecar_enabled(monkeypatch):
+    monkeypatch.setattr(config_loader, "CONFIG_JSON_CACHE_ENABLED", True)
+
+
+@pytest.mark.usefixtures("sidecar_enabled")
+def test_sidecar_is_reused_across_processes(config_file, monkeypatch):
+    load_yaml_config(str(config_file))
+    assert _sidecar_path(config_file).exists()
+
+    # A fresh process only has the on-disk sidecar
+    load_yaml_config.cache_clear()
+    parses = _count_parses(monkeypatch)
+    assert load_yaml_config(str(config_file))["name"] == "First"
+    assert parses == []
+
+
+@pytest.mark.usefixtures("sidecar_enabled")
+def test_stale_sidecar_is_ignored(config_file):
+    load_yaml_config(str(config_file))
+    _rewrite(config_file, "Second")
+    load_yaml_config.cache_clear()
+
+    assert load_yaml_config(str(config_file))["name"] == "Second"
+
+
+@pytest.mark.usefixtures("sidecar_enabled")
+def test_corrupt_sidecar_falls_back_to_yaml(config_file):
+    sidecar = _sidecar_path(config_file)
+    sidecar.parent.mkdir()
+    sidecar.write_bytes(b"{not json")
+
+    assert load_yaml_config(str(config_file))["name"] == "First"
+
+
+def test_sidecar_is_not_written_when_disabled(config_file):
+    load_yaml_config(str(config_file))
+    assert not _sidecar_path(config_file).exists()
+
+
+def test_load_agent_config_follows_file_changes(config_file, monkeypatch):
+    monkeypatch.setenv("TEST_AOAI_ENDPOINT", "https://aoai.test")
+    config = load_agent_config("TEST_AGENT", str(config_file))
+    assert config["name"] == "First"
+    assert config["azure_openai"]["endpoint"] == "https://aoai.test"
+
+    _rewrite(config_file, "Second")
+    assert load_agent_config("TEST_AGENT", str(config_file))["name"] == "Second"
+
+
+class _FakeResponse:
+    def __init__(self, status_code, content=b"", etag=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    """Serves one YAML document with an ETag, answering 304 when it matches."""
+
+    def __init__(self):
+        self.name = "First"
+        self.requests = []
+
+    def get(self, url, headers, timeout):
+        self.requests.append(headers)
+        etag = f'"{self.name}"'
+        if headers.get("If-None-Match") == etag:
+            return _FakeResponse(304)
+        return _FakeResponse(200, CONFIG_YAML.format(name=self.name).encode(), etag)
+
+
+def test_remote_agent_config_is_revalidated(monkeypatch):
+    url = "https://config.test/conf.yaml"
+    session = _FakeSession()
+    clock = [0.0]
+    monkeypatch.setattr(config_loader, "_get_http_session", lambda: session)
+    monkeypatch.setattr(config_loader.time, "monotonic", lambda: clock[0])
+
+    assert load_agent_config("TEST_AGENT", url)["name"] == "First"
+    load_agent_config("TEST_AGENT", url)
+    assert len(session.requests) == 1  # served from the resolved-config cache
+
+    clock[0] += config_loader.REMOTE_CONFIG_REVALIDATE_SEC
+    assert load_agent_config("TEST_AGENT", url)["name"] == "First"
+    assert session.requests[-1] == {"If-None-Match": '"First"'}  # answered 304
+
+    session.name = "Second"
+    clock[0] += config_loader.REMOTE_CONFIG_REVALIDATE_SEC
+    assert load_agent_config("TEST_AGENT", url)["name"] == "Second"
@@ -0,0 +1,43 @@
+"""Tests for the Fabric run polling backoff."""
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from src.agents.dataagents import main as dataagents  # noqa: E402
+from src.agents.dataagents.main import (  # noqa: E402
+    DEFAULT_POLL_INTERVAL_SEC,
+    FIRST_POLL_DELAY_SEC,
+    _next_poll_delay,
+)
+
+
+def _delays(poll_interval_sec, count=50):
+    delay = min(FIRST_POLL_DELAY_SEC, poll_interval_sec)
+    delays = []
+    for _ in range(count):
+        delay = _next_poll_delay(delay, poll_interval_sec)
+        delays.append(delay)
+    return delays
+
+
+@pytest.mark.parametrize("poll_interval_sec", [0.1, DEFAULT_POLL_INTERVAL_SEC, 5])
+def test_delays_never_exceed_poll_interval(poll_interval_sec):
+    assert max(_delays(poll_interval_sec)) <= poll_interval_sec
+
+
+def test_first_poll_is_fast():
+    assert _delays(DEFAULT_POLL_INTERVAL_SEC, count=1)[0] <= 3 * FIRST_POLL_DELAY_SEC
+
+
+def test_delays_are_jittered(monkeypatch):
+    bounds = []
+
+    def uniform(low, high):
+        bounds.append((low, high))
+        return high
+
+    monkeypatch.setattr(dataagents.random, "uniform", uniform)
+    _next_poll_delay(0.5, DEFAULT_POLL_INTERVAL_SEC)
+    assert bounds == [(FIRST_POLL_DELAY_SEC, 1.5)]
@@ -0,0 +1,81 @@
+"""Tests for the AirlineOpsContext tool result cache."""
+
+import pytest
+
+from app.agent_registry.AirlineOpsContext import _cache
+from app.agent_registry.AirlineOpsContext._cache import (
+    TTLCache,
+    make_cache_key,
+    normalize_query,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic inside the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_value():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("k", "v")
+    clock[0] += 9.9
+    assert cache.get("k") == "v"
+    clock[0] += 0.2
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")  # "b" is now the least recently used
+    cache.set("c", "3")
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+@pytest.mark.parametrize("maxsize, ttl", [(4, 0), (4, -1), (0, 60)])
+def test_disabled_cache_stores_nothing(maxsize, ttl):
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    assert not cache.enabled
+    cache.set("k", "v")
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "How many flights were delayed?",
+        "  how many flights   were delayed  ",
+        '"How many flights were delayed?!"',
+        "`How many\tflights were\ndelayed.`",
+    ],
+)
+def test_normalize_query_canonicalizes_trivial_differences(query):
+    assert normalize_query(query) == "how many flights were delayed"
+
+
+def test_cache_key_matches_equivalent_queries():
+    assert make_cache_key("https://x", "Flights today?", 1) == make_cache_key(
+        "https://x", "  flights today ", 1
+    )
+
+
+def test_cache_key_is_scoped_to_identity_and_endpoint():
+    base = make_cache_key("https://x", "flights today", 1)
+    assert make_cache_key("https://x", "flights today", 2) != base
+    assert make_cache_key("https://x", "flights today") != base
+    assert make_cache_key("https://y", "flights today", 1) != base
@@ -0,0 +1,105 @@
+"""Tests for Fabric result caching and single-flight in the AirlineOpsContext tools."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from app.agent_registry.AirlineOpsContext import tools  # noqa: E402
+from app.agent_registry.AirlineOpsContext._cache import (  # noqa: E402
+    fabric_response_cache,
+)
+
+
+class _FakeFabric:
+    """Stands in for aask_fabric_agent, answering with the caller's credential."""
+
+    def __init__(self, delay: float = 0.05, response: str = "answer") -> None:
+        self.delay = delay
+        self.response = response
+        self.calls = []
+
+    async def __call__(self, endpoint, question, credential):
+        self.calls.append((question, credential))
+        await asyncio.sleep(self.delay)
+        return f"{self.response} via {credential.credential}"
+
+
+@pytest.fixture
+def fabric(monkeypatch):
+    fake = _FakeFabric()
+    monkeypatch.setattr(tools, "aask_fabric_agent", fake)
+    monkeypatch.setattr(tools, "_airport_info_endpoint", "https://fabric.test")
+    monkeypatch.setattr(tools, "_azure_credential", None)
+    fabric_response_cache.clear()
+    yield fake
+    fabric_response_cache.clear()
+    tools._inflight.clear()
+
+
+async def _ask(credential, query):
+    """Run a tool call the way a session does: with its own credential bound."""
+    tools.use_azure_credential(credential)
+    return await tools.retrieve_operational_context(query)
+
+
+def test_identical_concurrent_queries_share_one_fabric_call(fabric):
+    async def main():
+        return await asyncio.gather(
+            _ask("userA", "Flights today?"), _ask("userA", "flights today")
+        )
+
+    assert asyncio.run(main()) == ["answer via userA"] * 2
+    assert len(fabric.calls) == 1
+
+
+def test_sessions_never_share_results(fabric):
+    async def main():
+        concurrent = await asyncio.gather(
+            _ask("userA", "flights today"), _ask("userB", "flights today")
+        )
+        cached = await _ask("userB", "flights today")
+        return concurrent, cached
+
+    concurrent, cached = asyncio.run(main())
+    assert concurrent == ["answer via userA", "answer via userB"]
+    assert cached == "answer via userB"
+    assert [c.credential for _, c in fabric.calls] == ["userA", "userB"]
+
+
+def test_cancelled_caller_does_not_cancel_joiners(fabric):
+    async def main():
+        leader = asyncio.create_task(_ask("userA", "flights today"))
+        await asyncio.sleep(0)
+        joiner = asyncio.create_task(_ask("userA", "flights today"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await joiner, leader
+
+    answer, leader = asyncio.run(main())
+    assert leader.cancelled()
+    assert answer == "answer via userA"
+    assert len(fabric.calls) == 1
+
+
+def test_repeated_query_is_served_from_cache(fabric):
+    async def main():
+        await _ask("userA", "flights today")
+        return await _ask("userA", "Flights today?")
+
+    assert asyncio.run(main()) == "answer via userA"
+    assert len(fabric.calls) == 1
+
+
+def test_error_responses_are_not_cached(fabric):
+    fabric.response = "Error querying Fabric agent: timeout"
+
+    async def main():
+        await _ask("userA", "flights today")
+        await _ask("userA", "flights today")
+
+    asyncio.run(main())
+    assert len(fabric.calls) == 2
@@ -0,0 +1,110 @@
+"""Tests for the shared background event loop."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from app.runtime import AsyncRuntime
+
+# Upper bound for anything that should finish promptly; a hang fails the test
+TIMEOUT_SEC = 5.0
+
+
+@pytest.fixture
+def runtime():
+    rt = AsyncRuntime(name="test-runtime")
+    yield rt
+    rt.loop.call_soon_threadsafe(rt.loop.stop)
+
+
+def _consume(iterator):
+    """Drain an iterator on another thread, returning (items, error, finished)."""
+    items, outcome = [], {}
+
+    def run():
+        try:
+            for item in iterator:
+                items.append(item)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(TIMEOUT_SEC)
+    return items, outcome.get("error"), not thread.is_alive()
+
+
+def test_submit_runs_coroutine_on_runtime_loop(runtime):
+    async def loop_thread_name():
+        return threading.current_thread().name
+
+    assert runtime.submit(loop_thread_name()).result(TIMEOUT_SEC) == "test-runtime"
+
+
+def test_iterate_yields_items_in_order(runtime):
+    async def numbers():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield i
+
+    items, error, finished = _consume(runtime.iterate(numbers()))
+    assert finished and error is None
+    assert items == [0, 1, 2]
+
+
+def test_iterate_keeps_context_for_whole_stream(runtime):
+    var = contextvars.ContextVar("var", default="unset")
+
+    async def stream():
+        var.set("bound")
+        await asyncio.sleep(0)
+        yield var.get()
+        await asyncio.sleep(0)
+        yield var.get()
+
+    items, _, _ = _consume(runtime.iterate(stream()))
+    assert items == ["bound", "bound"]
+
+
+def test_iterate_raises_stream_errors(runtime):
+    async def failing():
+        yield "partial"
+        raise ValueError("boom")
+
+    items, error, finished = _consume(runtime.iterate(failing()))
+    assert finished
+    assert items == ["partial"]
+    assert isinstance(error, ValueError)
+
+
+def test_iterate_does_not_hang_when_stream_is_cancelled(runtime):
+    async def cancelled():
+        yield "partial"
+        # e.g. awaiting a shared future that another caller cancelled
+        future = asyncio.get_running_loop().create_future()
+        future.cancel()
+        await future
+
+    items, error, finished = _consume(runtime.iterate(cancelled()))
+    assert finished, "consumer blocked after the stream was cancelled"
+    assert items == ["partial"]
+    assert isinstance(error, asyncio.CancelledError)
+
+
+def test_closing_iterator_early_cancels_the_stream(runtime):
+    closed = threading.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield "tick"
+                await asyncio.sleep(0.01)
+        finally:
+            closed.set()
+
+    iterator = runtime.iterate(endless())
+    assert next(iterator) == "tick"
+    iterator.close()
+    assert closed.wait(TIMEOUT_SEC)
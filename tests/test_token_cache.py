@@ -0,0 +1,73 @@
+"""Tests for the background-refreshing Fabric token cache."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from app.agent_registry.AirlineOpsContext._token_cache import CachedTokenCredential
+
+
+class _CountingCredential:
+    """Sync credential returning tokens that expire ``lifetime`` seconds from now."""
+
+    def __init__(self, lifetime: float = 3600.0) -> None:
+        self.lifetime = lifetime
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        time.sleep(0.01)
+        return SimpleNamespace(token=f"t{n}", expires_on=time.time() + self.lifetime)
+
+
+def test_concurrent_cold_callers_share_one_fetch():
+    credential = _CountingCredential()
+    wrapper = CachedTokenCredential(credential)
+
+    async def main():
+        return await asyncio.gather(*[wrapper.get_token("scope") for _ in range(5)])
+
+    tokens = asyncio.run(main())
+    assert credential.calls == 1
+    assert {t.token for t in tokens} == {"t1"}
+
+
+def test_fresh_token_is_served_from_cache():
+    credential = _CountingCredential()
+    wrapper = CachedTokenCredential(credential)
+
+    async def main():
+        first = await wrapper.get_token("scope")
+        second = await wrapper.get_token("scope")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert credential.calls == 1
+
+
+def test_token_near_expiry_is_returned_while_refreshing():
+    credential = _CountingCredential(lifetime=120.0)
+    wrapper = CachedTokenCredential(credential, refresh_margin_sec=300.0)
+
+    async def main():
+        first = await wrapper.get_token("scope")
+        second = await wrapper.get_token("scope")  # stale-while-revalidate
+        await asyncio.gather(*wrapper._background)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert second is first
+    assert credential.calls == 2
+
+
+def test_each_wrapper_has_a_distinct_identity():
+    credential = _CountingCredential()
+    assert (
+        CachedTokenCredential(credential).identity
+        != CachedTokenCredential(credential).identity
+    )
@@ -1,5 +1,9 @@
+import atexit
 import functools
 import logging
+import logging.handlers
+import queue
+import threading
 import time
 from typing import Callable, Optional
 
@@ -36,6 +40,49 @@ class CustomFormatter(logging.Formatter):  # type: ignore
         return super().format(record)
 
 
+# Shared queue drained by a background listener thread, so emitting a record
+# only costs an enqueue on the calling thread (e.g. the asyncio event loop)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_listener_lock = threading.Lock()
+
+
+def _default_formatter() -> logging.Formatter:
+    return CustomFormatter(
+        "%(asctime)s - %(name)s - %(processName)-10s - "
+        "%(levelname)-8s %(message)s (%(filename)s:%(funcName)s:%(lineno)d)"
+    )
+
+
+def start_queue_listener() -> logging.handlers.QueueListener:
+    """
+    Start (once) the background listener that writes queued records to stderr.
+
+    Returns:
+    logging.handlers.QueueListener: The running listener.
+    """
+    global _queue_listener
+    with _queue_listener_lock:
+        if _queue_listener is None:
+            sh = logging.StreamHandler()  # type: ignore
+            sh.setFormatter(_default_formatter())
+            _queue_listener = logging.handlers.QueueListener(
+                _log_queue, sh, respect_handler_level=True
+            )
+            _queue_listener.start()
+            atexit.register(stop_queue_listener)
+    return _queue_listener
+
+
+def stop_queue_listener() -> None:
+    """Flush pending records and stop the background listener, if running."""
+    global _queue_listener
+    with _queue_listener_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            _queue_listener = None
+
+
 def get_logger(
     name: str = "micro",
     level: Optional[int] = None,
@@ -45,30 +92,28 @@ def get_logger(
     """
     Returns a configured logger with a custom name, level, and formatter.
 
+    Stream output goes through a QueueHandler; formatting and the write to
+    stderr happen on a background QueueListener thread.
+
     Parameters:
     name (str): Name of the logger.
     level (int, optional): Initial logging level. Defaults to INFO if not provided.
-    include_stream_handler (bool): Whether to include a stream handler. Defaults to True.
+    include_stream_handler (bool): Whether to include a (queued) stream handler. Defaults to True.
 
     Returns:
     logging.Logger: Configured logger instance.
     """
     if tracing_enabled:
         pass
-    formatter = CustomFormatter(
-        "%(asctime)s - %(name)s - %(processName)-10s - "
-        "%(levelname)-8s %(message)s (%(filename)s:%(funcName)s:%(lineno)d)"
-    )
     logger = logging.getLogger(name)  # type: ignore
 
     # Set the logging level if it's specified or if the logger has no level set
     if level is not None or logger.level == 0:
         logger.setLevel(level or logging.INFO)  # type: ignore
 
-    if include_stream_handler and not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):  # type: ignore
-        sh = logging.StreamHandler()  # type: ignore
-        sh.setFormatter(formatter)
-        logger.addHandler(sh)
+    if include_stream_handler and not any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):  # type: ignore
+        start_queue_listener()
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
     return logger
 